@@ -1,126 +1,81 @@
-"""Application entrypoint to run backend API and local frontend server."""
+"""Application entrypoint to run the backend API, which also serves the frontend."""
 
 from __future__ import annotations
 
 import argparse
-import contextlib
-import threading
-import time
-import urllib.error
-import urllib.request
-import webbrowser
-from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
-from pathlib import Path
+import importlib.util
+import os
 
 import uvicorn
 
-from backend.app import app
+from backend.app import OPEN_BROWSER_ENV, app
 from backend.db_backup import backup_on_startup, run_backup_cli, run_restore_cli
 
 __all__ = ["app"]
 
 
-BACKEND_HOST = "0.0.0.0"
+# Loopback by default; set CATALYST_BIND=0.0.0.0 for container deployments.
+BACKEND_HOST = os.getenv("CATALYST_BIND", "127.0.0.1")
 BACKEND_PORT = 8000
-FRONTEND_PORT = 3000
 FRONTEND_PATH = "/frontend/"
-PROJECT_ROOT = Path(__file__).resolve().parent
-
-
-def _start_frontend_server() -> tuple[ThreadingHTTPServer, threading.Thread]:
-    class CatalystRequestHandler(SimpleHTTPRequestHandler):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, directory=str(PROJECT_ROOT), **kwargs)
-
-        def handle(self) -> None:  # pragma: no cover - integration behaviour
-            try:
-                super().handle()
-            except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
-                pass
-
-        def send_head(self):  # TODO: Remove when adding real favicon
-            if self.path == "/favicon.ico":
-                self.send_response(204)
-                self.end_headers()
-                return None
-            return super().send_head()
-
-    httpd = ThreadingHTTPServer(("127.0.0.1", FRONTEND_PORT), CatalystRequestHandler)
-    httpd.daemon_threads = True
-
-    server_thread = threading.Thread(
-        target=httpd.serve_forever,
-        name="frontend-http-server",
-        daemon=True,
-    )
-    server_thread.start()
-    return httpd, server_thread
 
 
-def _open_frontend_when_backend_ready(stop_event: threading.Event) -> None:
-    backend_probe_url = f"http://127.0.0.1:{BACKEND_PORT}/"
-    while not stop_event.is_set():
-        try:
-            with urllib.request.urlopen(backend_probe_url, timeout=1):
-                break
-        except (urllib.error.URLError, TimeoutError, ConnectionError):
-            time.sleep(0.5)
-        except Exception:
-            time.sleep(0.5)
-    else:
-        return
+def _uvicorn_runtime_options() -> dict[str, str]:
+    """Prefer the libuv event loop and C HTTP parser, falling back to stdlib."""
+
+    def _available(module: str) -> bool:
+        return importlib.util.find_spec(module) is not None
+
+    return {
+        # uvloop does not support Windows; asyncio is the portable fallback.
+        "loop": "uvloop" if _available("uvloop") else "asyncio",
+        "http": "httptools" if _available("httptools") else "h11",
+    }
 
-    if stop_event.is_set():
-        return
 
-    frontend_url = f"http://localhost:{FRONTEND_PORT}{FRONTEND_PATH}"
-    print(f"🌐 Opening browser to {frontend_url}")
-    webbrowser.open(frontend_url)
+def _uvicorn_process_options() -> dict[str, object]:
+    """Reload only when asked; otherwise run a fixed pool of workers.
+
+    ``CATALYST_RELOAD=1`` enables the file watcher (scoped to ``backend/``).
+    ``CATALYST_WORKERS`` sizes the worker pool and defaults to 1 because the
+    rate limiter keeps its quota state in-process.
+    """
+
+    if os.getenv("CATALYST_RELOAD", "0") == "1":
+        return {"reload": True, "reload_dirs": ["backend"], "reload_delay": 0.25}
+    return {"reload": False, "workers": int(os.getenv("CATALYST_WORKERS", "1"))}
 
 
 def main() -> None:
     backup_on_startup()
 
-    frontend_server: ThreadingHTTPServer | None = None
-    frontend_thread: threading.Thread | None = None
-    backend_ready_thread: threading.Thread | None = None
-    stop_event = threading.Event()
-    try:
-        print(
-            f"🚀 Starting frontend server at http://localhost:{FRONTEND_PORT}{FRONTEND_PATH}"
-        )
-        frontend_server, frontend_thread = _start_frontend_server()
-
-        # Give the frontend server a moment to begin accepting connections
-        time.sleep(1)
+    process_options = _uvicorn_process_options()
+    frontend_url = f"http://localhost:{BACKEND_PORT}{FRONTEND_PATH}"
+    single_process = (
+        not process_options["reload"] and process_options.get("workers", 1) == 1
+    )
+    # The app opens the browser from its lifespan once the loop is running.
+    # Skip it when uvicorn would start that lifespan more than once (reloads
+    # or multiple workers) so only one tab is opened.
+    if single_process:
+        os.environ[OPEN_BROWSER_ENV] = frontend_url
 
+    try:
         print(f"⚙️  Starting backend API at http://localhost:{BACKEND_PORT}")
-        backend_ready_thread = threading.Thread(
-            target=_open_frontend_when_backend_ready,
-            args=(stop_event,),
-            name="backend-ready-watcher",
-            daemon=True,
-        )
-        backend_ready_thread.start()
+        print(f"🚀 Frontend served at {frontend_url}")
         uvicorn.run(
-            "backend.app:app",
+            # Reuse the app imported above instead of importing it again; the
+            # reloader and worker pool need an import string to spawn children.
+            app if single_process else "backend.app:app",
+            factory=False,
             host=BACKEND_HOST,
             port=BACKEND_PORT,
-            reload=True,
+            **process_options,
+            **_uvicorn_runtime_options(),
         )
     except KeyboardInterrupt:
         print("\n🛑 Shutdown requested by user.")
     finally:
-        stop_event.set()
-        if backend_ready_thread is not None:
-            backend_ready_thread.join(timeout=2)
-        if frontend_server is not None:
-            print("🧹 Stopping frontend server...")
-            with contextlib.suppress(Exception):
-                frontend_server.shutdown()
-                frontend_server.server_close()
-        if frontend_thread is not None:
-            frontend_thread.join(timeout=2)
         print("✨ All services stopped.")
 
 
@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import webbrowser
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 
+from .config import FRONTEND_DIR
 from .database import init_database
 from .routers import register_routers
 
+# Set by the root app.py launcher to the URL the browser should open once.
+OPEN_BROWSER_ENV = "CATALYST_OPEN_BROWSER"
+
+
+async def _open_browser(url: str) -> None:  # pragma: no cover - desktop side effect
+    # Only defers past lifespan startup: uvicorn binds the socket after startup
+    # completes, so it may not be listening yet, but the browser process takes
+    # far longer to come up. The blocking launch stays off the loop.
+    await asyncio.sleep(0)
+    print(f"🌐 Opening browser to {url}")
+    await asyncio.get_running_loop().run_in_executor(None, webbrowser.open, url)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # pragma: no cover - startup/shutdown glue
     init_database()
     print("🔥 The Catalyst is online - FastAPI backend ready")
+    browser_url = os.environ.pop(OPEN_BROWSER_ENV, None)
+    if browser_url:
+        app.state.browser_task = asyncio.create_task(_open_browser(browser_url))
     yield
     print("The Catalyst backend shutting down...")
 
@@ -27,10 +47,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browsers reuse a preflight for 2h (Chromium's cap) instead of 10 min.
+    max_age=7200,
 )
 
 register_routers(app)
 
+# Serve the static UI from the API process so there is a single listener.
+app.mount(
+    "/frontend",
+    StaticFiles(directory=str(FRONTEND_DIR), html=True),
+    name="frontend",
+)
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -5,13 +5,15 @@ from __future__ import annotations
 import ast
 import asyncio
 import hashlib
-import json
 import random
 import re
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from enum import Enum
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
+import orjson
 from fastapi import HTTPException
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -19,6 +21,8 @@ from sqlalchemy.orm import Session
 from .config import (
     ALT_MODEL_NAME,
     ENVELOPE_FORMAT,
+    EXPECTED_OUTPUT_TOKENS,
+    LTM_TOKEN_LIMIT,
     MODEL_NAME,
     SHOW_THINKING,
     SYSTEM_PROMPT_PATH,
@@ -33,9 +37,9 @@ from .functions import apply_envelope_actions, catalyst_functions
 from .llm_client import acompletion, is_configured
 from .memory_manager import extract_section
 from .models import LTMProfile
-from .rate_limiter import estimate_tokens, rate_limiter
+from .rate_limiter import calibrate_token_estimate, estimate_tokens, rate_limiter
 from .schemas import SessionType
-from .time_utils import local_now
+from .time_utils import local_now, parse_iso_timestamp
 
 # Retry configuration
 MAX_RETRIES = 4
@@ -43,6 +47,11 @@ BASE_DELAY = 1.0  # Base delay in seconds
 MAX_DELAY = 60.0  # Maximum delay in seconds
 JITTER_RANGE = 0.1  # Jitter factor for randomization
 
+# Circuit breaker: after this many consecutive retryable failures a model is
+# skipped until the cooldown elapses, then one probe call is let through.
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN = 300.0  # Seconds
+
 DEFAULT_FALLBACK_RESPONSE = "I'm here and ready to help you achieve your goals."
 SAFETY_FALLBACK_RESPONSE = (
     "I want to keep our momentum strong, but the model flagged the last request for "
@@ -55,6 +64,12 @@ OutputMode = Literal["structured", "greeting", "plain"]
 _parse_structured_envelope = parse_envelope
 
 _api_request_log_count = 0
+_model_failures: Dict[str, int] = {}
+_model_tripped_at: Dict[str, float] = {}
+
+_STATUS_CODE_RE = re.compile(r"\b(\d{3})\b")
+_RETRY_DELAY_RE = re.compile(r"([0-9]+(?:\.[0-9]+)?)s")
+_RETRY_IN_RE = re.compile(r"retry in\s+([0-9]+(?:\.[0-9]+)?)s", re.IGNORECASE)
 
 def _is_retryable_error(error: Exception) -> bool:
     """Check if an error is retryable (503 overload / connection errors)."""
@@ -82,9 +97,10 @@ def _parse_quota_error(error: Exception) -> Optional[QuotaErrorInfo]:
 
     status_code: Optional[int] = getattr(error, "status_code", None)
     payload: Optional[Dict[str, Any]] = getattr(error, "response", None)
+    error_text = str(error)
 
     if status_code is None:
-        match = re.search(r"\b(\d{3})\b", str(error))
+        match = _STATUS_CODE_RE.search(error_text)
         if match:
             status_code = int(match.group(1))
 
@@ -99,11 +115,11 @@ def _parse_quota_error(error: Exception) -> Optional[QuotaErrorInfo]:
     else:
         error_payload = None
 
-    if error_payload is None and "{" in str(error):
+    if error_payload is None and "{" in error_text:
+        raw_payload = error_text[error_text.index("{") :]
         try:
-            raw_payload = str(error)[str(error).index("{") :]
-            parsed_payload = json.loads(raw_payload)
-        except (ValueError, json.JSONDecodeError):
+            parsed_payload = orjson.loads(raw_payload)
+        except ValueError:
             try:
                 parsed_payload = ast.literal_eval(raw_payload)
             except (SyntaxError, ValueError):
@@ -122,7 +138,7 @@ def _parse_quota_error(error: Exception) -> Optional[QuotaErrorInfo]:
                 if isinstance(retry_delay_value, (int, float)):
                     retry_after = float(retry_delay_value)
                 elif isinstance(retry_delay_value, str):
-                    match = re.match(r"([0-9]+(?:\.[0-9]+)?)s", retry_delay_value)
+                    match = _RETRY_DELAY_RE.match(retry_delay_value)
                     if match:
                         retry_after = float(match.group(1))
             if retry_after is None:
@@ -133,14 +149,12 @@ def _parse_quota_error(error: Exception) -> Optional[QuotaErrorInfo]:
                             continue
                         hint = violation.get("description") or violation.get("message")
                         if hint and retry_after is None:
-                            match = re.search(
-                                r"retry in\s+([0-9]+(?:\.[0-9]+)?)s", hint.lower()
-                            )
+                            match = _RETRY_IN_RE.search(hint)
                             if match:
                                 retry_after = float(match.group(1))
 
     if retry_after is None:
-        match = re.search(r"retry in\s+([0-9]+(?:\.[0-9]+)?)s", str(error).lower())
+        match = _RETRY_IN_RE.search(error_text)
         if match:
             retry_after = float(match.group(1))
 
@@ -148,6 +162,49 @@ def _parse_quota_error(error: Exception) -> Optional[QuotaErrorInfo]:
     return QuotaErrorInfo(status_code=429, message=message, retry_after=retry_after)
 
 
+def _breaker_open(model: str) -> bool:
+    """Return True while ``model`` is tripped and still cooling down.
+
+    The first check after the cooldown restarts it and returns False, so that
+    caller is the single probe; concurrent callers keep skipping the model
+    until the probe's success clears the breaker.
+    """
+    tripped_at = _model_tripped_at.get(model)
+    if tripped_at is None:
+        return False
+    now = time.monotonic()
+    if now - tripped_at < BREAKER_COOLDOWN:
+        return True
+    _model_tripped_at[model] = now
+    return False
+
+
+def _record_model_failure(model: str) -> None:
+    failures = _model_failures.get(model, 0) + 1
+    _model_failures[model] = failures
+    if failures >= BREAKER_THRESHOLD:
+        _model_tripped_at[model] = time.monotonic()
+
+
+def _record_model_success(model: str) -> None:
+    _model_failures.pop(model, None)
+    _model_tripped_at.pop(model, None)
+
+
+def _calibrate_from_usage(messages: List[Dict[str, Any]], response: Any) -> None:
+    """Feed the provider's prompt token count back into ``estimate_tokens``."""
+    usage = getattr(response, "usage", None)
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    if not isinstance(prompt_tokens, int):
+        return
+    prompt_chars = sum(
+        len(message["content"])
+        for message in messages
+        if isinstance(message.get("content"), str)
+    )
+    calibrate_token_estimate(prompt_chars, prompt_tokens)
+
+
 def _calculate_retry_delay(attempt: int) -> float:
     """Calculate exponential backoff delay with jitter."""
     delay = min(BASE_DELAY * (2**attempt), MAX_DELAY)
@@ -155,6 +212,15 @@ def _calculate_retry_delay(attempt: int) -> float:
     return max(0.1, delay + jitter)
 
 
+def _quota_retry_delay(quota_info: QuotaErrorInfo, attempt: int) -> float:
+    """Wait the server-directed ``retry_after`` (plus up-only jitter) when given."""
+    if quota_info.retry_after:
+        return quota_info.retry_after + random.uniform(
+            0, JITTER_RANGE * quota_info.retry_after
+        )
+    return _calculate_retry_delay(attempt)
+
+
 async def _make_api_call_with_retry(
     model: str,
     messages: List[Dict[str, Any]],
@@ -162,11 +228,17 @@ async def _make_api_call_with_retry(
     tools: Optional[List[Dict[str, Any]]] = None,
     temperature: float = 0.7,
     estimated_prompt_tokens: int,
+    expected_output_tokens: int = EXPECTED_OUTPUT_TOKENS,
     context: str = "initial",
     response_format: Optional[Dict[str, str]] = None,
 ) -> Tuple[Any, str]:
-    """Make API call with retry logic, rate limiting, and model fallback."""
+    """Make API call with retry logic, rate limiting, and model fallback.
+
+    The limiter reservation covers the prompt plus ``expected_output_tokens``;
+    callers replace it with prompt + actual output via ``record_usage``.
+    """
     global _api_request_log_count
+    reserved_tokens = estimated_prompt_tokens + expected_output_tokens
     last_error = None
     primary_model = model
     fallback_model = ALT_MODEL_NAME if ALT_MODEL_NAME != primary_model else None
@@ -176,46 +248,48 @@ async def _make_api_call_with_retry(
         current_model = primary_model
         switched_due_to_limit = False
 
-        if attempt > 0 and fallback_model:
-            if last_was_retryable:
-                current_model = fallback_model
-                print(
-                    f"↪️  Switching to fallback model '{current_model}' for {context} "
-                    "call after primary failure"
-                )
-            else:
-                wait_primary = await rate_limiter.get_wait_time(
-                    primary_model, estimated_prompt_tokens
-                )
-                wait_fallback = await rate_limiter.get_wait_time(
-                    fallback_model, estimated_prompt_tokens
-                )
-
-                if wait_primary > 0:
-                    if wait_fallback == 0 or wait_fallback <= wait_primary:
-                        current_model = fallback_model
-                        switched_due_to_limit = True
-        elif attempt > 0 and not fallback_model:
-            pass
-
-        if attempt == 0 and fallback_model:
-            wait_primary = await rate_limiter.get_wait_time(
-                primary_model, estimated_prompt_tokens
+        if fallback_model and attempt > 0 and last_was_retryable:
+            current_model = fallback_model
+            print(
+                f"↪️  Switching to fallback model '{current_model}' for {context} "
+                "call after primary failure"
             )
-            if wait_primary > 0:
-                wait_fallback = await rate_limiter.get_wait_time(
-                    fallback_model, estimated_prompt_tokens
-                )
-                if wait_fallback == 0:
-                    current_model = fallback_model
-                    switched_due_to_limit = True
+        elif fallback_model:
+            waits = await rate_limiter.get_wait_times(
+                (primary_model, fallback_model), reserved_tokens
+            )
+            wait_primary = waits[primary_model]
+            wait_fallback = waits[fallback_model]
+            if wait_primary > 0 and (
+                wait_fallback == 0 or (attempt > 0 and wait_fallback <= wait_primary)
+            ):
+                current_model = fallback_model
+                switched_due_to_limit = True
 
         if switched_due_to_limit:
             print(
                 f"↪️  Switching to fallback model '{current_model}' for {context} call due to rate limit"
             )
 
-        await rate_limiter.wait_for_request(current_model, estimated_prompt_tokens)
+        if _breaker_open(current_model):
+            alternate = (
+                fallback_model if current_model == primary_model else primary_model
+            )
+            if not alternate or _breaker_open(alternate):
+                raise HTTPException(
+                    status_code=503,
+                    detail=(
+                        "AI service temporarily unavailable after repeated "
+                        f"failures on {current_model}; try again in a few minutes."
+                    ),
+                ) from last_error
+            print(
+                f"↪️  Skipping '{current_model}' for {context} call (circuit open); "
+                f"using '{alternate}'"
+            )
+            current_model = alternate
+
+        await rate_limiter.wait_for_request(current_model, reserved_tokens)
 
         try:
             if attempt > 0:
@@ -243,6 +317,8 @@ async def _make_api_call_with_retry(
                 )
 
             last_was_retryable = False
+            _record_model_success(current_model)
+            _calibrate_from_usage(messages, response)
             return response, current_model
 
         except Exception as exc:
@@ -270,6 +346,13 @@ async def _make_api_call_with_retry(
                 )
                 last_was_retryable = False
                 if attempt < MAX_RETRIES - 1:
+                    if not fallback_model:
+                        # The retry hits the same model, so wait out its window
+                        # here; with a fallback the limiter's cooldown steers
+                        # the next attempt to the other model instead.
+                        delay = _quota_retry_delay(quota_info, attempt)
+                        print(f"⏳ Waiting {delay:.1f}s before retry...")
+                        await asyncio.sleep(delay)
                     continue
                 raise last_error
 
@@ -279,6 +362,8 @@ async def _make_api_call_with_retry(
             if not last_was_retryable:
                 raise exc
 
+            _record_model_failure(current_model)
+
             if attempt < MAX_RETRIES - 1:
                 delay = _calculate_retry_delay(attempt)
                 print(
@@ -301,6 +386,32 @@ async def _make_api_call_with_retry(
     ) from last_error
 
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _json_safe(value: Any) -> Any:
+    """Copy ``value`` into JSON-ready containers, stringifying only odd leaves.
+
+    Strings and numbers are shared with the source rather than re-encoded, so
+    snapshotting a large context is a single walk with no intermediate buffer.
+    """
+
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str) else str(key): _json_safe(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, Enum):
+        return _json_safe(value.value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
 async def generate_catalyst_response(
     message: str,
     session_type: SessionType,
@@ -328,10 +439,7 @@ async def generate_catalyst_response(
         output_mode=output_mode,
         context_block=context_block,
     )
-    try:
-        context_snapshot = json.loads(json.dumps(context, default=str))
-    except TypeError:  # pragma: no cover - fallback for unexpected types
-        context_snapshot = context
+    context_snapshot = _json_safe(context)
 
     conversation: List[Dict[str, Any]] = [
         {"role": "system", "content": system_prompt},
@@ -381,20 +489,16 @@ async def generate_catalyst_response(
                 if output_mode == "greeting"
                 else _derive_fallback_message(response)
             )
-            await rate_limiter.record_usage(current_model_used, 0)
-        else:
-            actual_tokens = estimate_tokens(response_text)
-            await rate_limiter.record_usage(current_model_used, actual_tokens)
 
-    if output_mode == "structured" and response_text:
-        actual_tokens = estimate_tokens(response_text)
-        await rate_limiter.record_usage(current_model_used, actual_tokens)
+    await rate_limiter.record_usage(
+        current_model_used, estimated_tokens + estimate_tokens(raw_text)
+    )
 
     result = {
         "response": response_text,
         "memory_updated": memory_updated,
         "function_calls": executed_calls,
-        "thinking": json.dumps(executed_calls) if SHOW_THINKING else None,
+        "thinking": orjson.dumps(executed_calls).decode() if SHOW_THINKING else None,
         "model": current_model_used,
     }
 
@@ -466,6 +570,7 @@ async def update_ltm_memory(
             messages,
             temperature=0.3,
             estimated_prompt_tokens=estimated_tokens,
+            expected_output_tokens=LTM_TOKEN_LIMIT,
             context="ltm-synthesis",
         )
     except Exception as exc:  # pragma: no cover
@@ -475,7 +580,7 @@ async def update_ltm_memory(
     new_profile = _extract_response_text(response)
 
     memory_tokens = estimate_tokens(new_profile)
-    await rate_limiter.record_usage(model_used, memory_tokens)
+    await rate_limiter.record_usage(model_used, estimated_tokens + memory_tokens)
 
     sections = {
         "patterns": extract_section(new_profile, "Patterns"),
@@ -502,94 +607,71 @@ async def update_ltm_memory(
     return True
 
 
+_SESSION_INSTRUCTIONS: Dict[SessionType, str] = {
+    SessionType.MORNING: """
+    **Morning Ignition Protocol**:
+    1. Acknowledge their presence with energy
+    2. State their North Star goal clearly
+    3. Ask about their energy and readiness
+    4. Help them set 1-3 concrete intentions for the day
+    5. End with a powerful, motivating challenge
+    Keep it brief (5 minutes max) but impactful.
+    """,
+    SessionType.EVENING: """
+    **Evening Reflection Protocol**:
+    1. Welcome them back, acknowledge the day's effort
+    2. Ask them to share wins (celebrate these genuinely)
+    3. Explore challenges with curiosity, not judgment
+    4. Guide them to find gratitude (even in difficulty)
+    5. Help identify key lessons and patterns
+    6. Set tomorrow's top priority together
+    7. IMPORTANT: Synthesize insights for memory update
+    This is deeper work (10-15 minutes) - be thorough.
+    """,
+    SessionType.CATCH_UP: """
+    **Catch-Up Recovery Protocol**:
+    1. No judgment about missed sessions - life happens
+    2. Quick check on overall state and energy
+    3. Focus on the most important recent development
+    4. Rapidly identify what needs immediate attention
+    5. Reset momentum with one clear next action
+    Keep it supportive but action-oriented.
+    """,
+    SessionType.GENERAL: """
+    **General Interaction Mode**:
+    - Be responsive to their needs
+    - Default to Tough Coach unless context suggests otherwise
+    - Always connect conversation back to their goals
+    - Look for opportunities to reinforce positive patterns
+    """,
+    SessionType.INITIALIZATION: """
+    **Initialization Protocol**:
+    1. **Grounded Welcome** — acknowledge the decision with weight and respect. Signal importance without exaggeration.
+    2. **Clarify Goal** — help the user state their goal clearly, in their own words.
+    3. **Make it Measurable** — ensure the metric is specific and trackable.
+    4. **Check the Timeline** — confirm it's ambitious but achievable.
+    5. **Commitment Statement** — end with a clear, concise declaration: this is the starting point, momentum begins now.
+    This sets the tone for everything - make it count.
+    """,
+}
+
+
 def get_session_instructions(session_type: SessionType) -> str:
     """Return session-specific guidance for the AI."""
-    instructions = {
-        SessionType.MORNING: """
-        **Morning Ignition Protocol**:
-        1. Acknowledge their presence with energy
-        2. State their North Star goal clearly
-        3. Ask about their energy and readiness
-        4. Help them set 1-3 concrete intentions for the day
-        5. End with a powerful, motivating challenge
-        Keep it brief (5 minutes max) but impactful.
-        """,
-        SessionType.EVENING: """
-        **Evening Reflection Protocol**:
-        1. Welcome them back, acknowledge the day's effort
-        2. Ask them to share wins (celebrate these genuinely)
-        3. Explore challenges with curiosity, not judgment
-        4. Guide them to find gratitude (even in difficulty)
-        5. Help identify key lessons and patterns
-        6. Set tomorrow's top priority together
-        7. IMPORTANT: Synthesize insights for memory update
-        This is deeper work (10-15 minutes) - be thorough.
-        """,
-        SessionType.CATCH_UP: """
-        **Catch-Up Recovery Protocol**:
-        1. No judgment about missed sessions - life happens
-        2. Quick check on overall state and energy
-        3. Focus on the most important recent development
-        4. Rapidly identify what needs immediate attention
-        5. Reset momentum with one clear next action
-        Keep it supportive but action-oriented.
-        """,
-        SessionType.GENERAL: """
-        **General Interaction Mode**:
-        - Be responsive to their needs
-        - Default to Tough Coach unless context suggests otherwise
-        - Always connect conversation back to their goals
-        - Look for opportunities to reinforce positive patterns
-        """,
-        SessionType.INITIALIZATION: """
-        **Initialization Protocol**:
-        1. **Grounded Welcome** — acknowledge the decision with weight and respect. Signal importance without exaggeration.
-        2. **Clarify Goal** — help the user state their goal clearly, in their own words.
-        3. **Make it Measurable** — ensure the metric is specific and trackable.
-        4. **Check the Timeline** — confirm it's ambitious but achievable.
-        5. **Commitment Statement** — end with a clear, concise declaration: this is the starting point, momentum begins now.
-        This sets the tone for everything - make it count.
-        """,
-    }
-    return instructions.get(session_type, instructions[SessionType.GENERAL])
+    return _SESSION_INSTRUCTIONS.get(
+        session_type, _SESSION_INSTRUCTIONS[SessionType.GENERAL]
+    )
 
 
-def _load_base_prompt() -> Tuple[str, Dict[str, Any]]:
-    """Load the base system prompt text along with metadata."""
+_DEFAULT_BASE_PROMPT = "You are The Catalyst, an elite AI mentor."
 
-    if SYSTEM_PROMPT_PATH.exists():
-        try:
-            text = SYSTEM_PROMPT_PATH.read_text(encoding="utf-8")
-        except OSError:
-            text = "You are The Catalyst, an elite AI mentor."
-            metadata = {
-                "source": "default",
-                "path": None,
-                "checksum": hashlib.sha256(text.encode("utf-8")).hexdigest(),
-                "length": len(text),
-                "modified_at": None,
-            }
-            return text, metadata
+# ((st_mtime_ns, st_size), text, metadata) of the last prompt file read, so
+# steady-state calls cost one stat() instead of a read plus a sha256.
+_base_prompt_cache: Optional[Tuple[Tuple[int, int], str, Dict[str, Any]]] = None
 
-        checksum = hashlib.sha256(text.encode("utf-8")).hexdigest()
-        try:
-            stat = SYSTEM_PROMPT_PATH.stat()
-            modified_at = datetime.fromtimestamp(
-                stat.st_mtime, timezone.utc
-            ).isoformat()
-        except OSError:
-            modified_at = None
-
-        metadata = {
-            "source": "file",
-            "path": str(SYSTEM_PROMPT_PATH.resolve()),
-            "checksum": checksum,
-            "length": len(text),
-            "modified_at": modified_at,
-        }
-        return text, metadata
 
-    text = "You are The Catalyst, an elite AI mentor."
+def _default_base_prompt() -> Tuple[str, Dict[str, Any]]:
+    text = _DEFAULT_BASE_PROMPT
     metadata = {
         "source": "default",
         "path": None,
@@ -600,6 +682,37 @@ def _load_base_prompt() -> Tuple[str, Dict[str, Any]]:
     return text, metadata
 
 
+def _load_base_prompt() -> Tuple[str, Dict[str, Any]]:
+    """Load the base system prompt text along with metadata."""
+
+    global _base_prompt_cache
+
+    try:
+        stat = SYSTEM_PROMPT_PATH.stat()
+    except OSError:
+        return _default_base_prompt()
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _base_prompt_cache
+    if cached is not None and cached[0] == signature:
+        return cached[1], dict(cached[2])
+
+    try:
+        text = SYSTEM_PROMPT_PATH.read_text(encoding="utf-8")
+    except OSError:
+        return _default_base_prompt()
+
+    metadata = {
+        "source": "file",
+        "path": str(SYSTEM_PROMPT_PATH.resolve()),
+        "checksum": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        "length": len(text),
+        "modified_at": datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat(),
+    }
+    _base_prompt_cache = (signature, text, metadata)
+    return text, dict(metadata)
+
+
 def _build_system_prompt(
     session_type: SessionType,
     context: Dict[str, Any],
@@ -616,17 +729,20 @@ def _build_system_prompt(
     if context_block is None:
         context_block = build_context_block(context, session_type, timestamp_source)
 
-    prompt = (
-        f"{base_prompt}\n\n{context_block}\n\n"
-        f"## Session-Specific Instructions:\n\n{get_session_instructions(session_type)}\n"
-    )
-
+    parts = [
+        base_prompt,
+        "\n\n",
+        context_block,
+        "\n\n## Session-Specific Instructions:\n\n",
+        get_session_instructions(session_type),
+        "\n",
+    ]
     if output_mode == "structured":
-        prompt += f"\n{format_output_instructions()}\n"
+        parts += ("\n", format_output_instructions(), "\n")
     elif output_mode == "greeting":
-        prompt += f"\n{GREETING_OUTPUT_INSTRUCTIONS}\n"
+        parts += ("\n", GREETING_OUTPUT_INSTRUCTIONS, "\n")
 
-    return prompt
+    return "".join(parts)
 
 
 def _greeting_fallback(context: Dict[str, Any], session_type: SessionType) -> str:
@@ -645,19 +761,6 @@ def _greeting_fallback(context: Dict[str, Any], session_type: SessionType) -> st
     )
 
 
-def _parse_reference_timestamp(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    normalised = value.replace("Z", "+00:00")
-    try:
-        parsed = datetime.fromisoformat(normalised)
-    except ValueError:
-        return None
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-    return parsed
-
-
 def reconstruct_system_prompt(
     session_type: SessionType,
     context: Dict[str, Any],
@@ -666,7 +769,7 @@ def reconstruct_system_prompt(
     base_prompt_text, runtime_metadata = _load_base_prompt()
     generated_at = None
     if reference:
-        generated_at = _parse_reference_timestamp(reference.get("generated_at"))
+        generated_at = parse_iso_timestamp(reference.get("generated_at"))
 
     prompt = _build_system_prompt(
         session_type,
@@ -737,7 +840,7 @@ def _extract_response_text(response: Any) -> str:
 
 def _summarize_empty_response(response: Any) -> str:
     if not getattr(response, "choices", None):
-        return json.dumps({"choices": []})
+        return orjson.dumps({"choices": []}).decode()
 
     choice = response.choices[0]
     message = choice.message
@@ -748,7 +851,7 @@ def _summarize_empty_response(response: Any) -> str:
     }
 
     try:
-        return json.dumps(debug_payload)
+        return orjson.dumps(debug_payload).decode()
     except TypeError:
         return str(debug_payload)
 
@@ -834,13 +937,13 @@ def _normalise_args(raw_args: Any) -> Dict[str, Any]:
         return raw_args.to_dict()
     if hasattr(raw_args, "to_json"):
         try:
-            return json.loads(raw_args.to_json())
+            return orjson.loads(raw_args.to_json())
         except Exception:  # pragma: no cover - defensive
             return {}
     if isinstance(raw_args, str):
         try:
-            return json.loads(raw_args)
-        except json.JSONDecodeError:
+            return orjson.loads(raw_args)
+        except orjson.JSONDecodeError:
             return {"value": raw_args}
     return {}
 
@@ -891,6 +994,6 @@ def _parse_model_response(
         "response": final_text,
         "memory_updated": bool(executed_calls),
         "function_calls": executed_calls,
-        "thinking": json.dumps(executed_calls) if SHOW_THINKING else None,
+        "thinking": orjson.dumps(executed_calls).decode() if SHOW_THINKING else None,
         "model": model_used,
     }
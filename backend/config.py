@@ -15,6 +15,7 @@ load_dotenv()
 BASE_DIR: Final[Path] = Path(__file__).resolve().parent.parent
 DATA_DIR: Final[Path] = BASE_DIR / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
+FRONTEND_DIR: Final[Path] = BASE_DIR / "frontend"
 
 # Database configuration
 DEFAULT_DATABASE_URL = f"sqlite:///{(DATA_DIR / 'catalyst.db').as_posix()}"
@@ -28,6 +29,9 @@ ALT_MODEL_NAME: Final[str] = os.getenv("ALT_MODEL_NAME", "gemini-2.5-flash")
 GEMINI_API_KEY: Final[str] = os.getenv("GEMINI_API_KEY", "")
 SHOW_THINKING: Final[bool] = os.getenv("SHOW_THINKING", "false").lower() == "true"
 
+# IANA zone for local dates/times (e.g. "America/Los_Angeles"); empty = system zone
+LOCAL_TIMEZONE: Final[str] = os.getenv("CATALYST_TIMEZONE", "")
+
 
 def _env_prefix(model: str) -> str:
     """Convert a model name into an uppercase env prefix."""
@@ -62,6 +66,9 @@ MODEL_RATE_LIMITS: Final[Dict[str, Dict[str, int]]] = {
     for model, limits in _DEFAULT_RATE_LIMITS.items()
 }
 
+# Output tokens reserved per call on top of the prompt (TPM counts both)
+EXPECTED_OUTPUT_TOKENS: Final[int] = int(os.getenv("EXPECTED_OUTPUT_TOKENS", 1024))
+
 # Memory management constants
 LTM_TOKEN_LIMIT: Final[int] = int(os.getenv("LTM_TOKEN_LIMIT", 2000))
 CATCH_UP_THRESHOLD_HOURS: Final[int] = int(os.getenv("CATCH_UP_THRESHOLD", 36))
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import orjson
 import toons
 
 from .config import CONTEXT_FORMAT
@@ -143,7 +143,7 @@ def format_goals(goals: List[Dict[str, Any]], *, context_format: str) -> str:
         return "No active goals."
 
     if context_format == "markdown":
-        return json.dumps(rows, indent=2)
+        return orjson.dumps(rows, option=orjson.OPT_INDENT_2).decode()
 
     payload = {"goals": rows}
     return toons.dumps(payload).strip()
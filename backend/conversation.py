@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from fastapi import HTTPException
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
 
 from . import models
@@ -18,12 +19,16 @@ from .memory_manager import (
     get_ltm_profile_by_id,
     get_ltm_profile_by_version,
     get_recent_insights,
+    serialize_goal_row,
 )
 from .schemas import SessionType
-from .time_utils import to_local, utc_now
+from .time_utils import local_now, parse_iso_timestamp, to_local, utc_now
 
 RECENT_CONVERSATION_CHAR_LIMIT = 24000
 
+# Sort key for transcript entries whose timestamp does not parse.
+_EARLIEST = datetime.min.replace(tzinfo=timezone.utc)
+
 SESSION_LABELS = {
     SessionType.MORNING.value: "Morning",
     SessionType.EVENING.value: "Evening",
@@ -41,19 +46,8 @@ ROLE_ICONS = {
 }
 
 
-def conversation_id_for_record(
-    record: models.Conversation, messages: Dict[str, Any]
-) -> str:
-    if getattr(record, "conversation_uuid", None):
-        return str(record.conversation_uuid)
-    conversation_id = messages.get("conversation_id")
-    if conversation_id:
-        return str(conversation_id)
-    return f"legacy-{record.id}"
-
-
 def message_timestamp(
-    messages: Dict[str, Any], record: models.Conversation
+    messages: Dict[str, Any], record: Union[models.Conversation, Row]
 ) -> Optional[str]:
     timestamp_str: Optional[str] = messages.get("timestamp")
     if timestamp_str:
@@ -66,19 +60,6 @@ def message_timestamp(
     return None
 
 
-def parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    normalized = value.replace("Z", "+00:00")
-    try:
-        parsed = datetime.fromisoformat(normalized)
-    except ValueError:
-        return None
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-    return parsed
-
-
 def conversation_session_label(value: Optional[str]) -> Optional[str]:
     if value is None:
         return None
@@ -99,17 +80,11 @@ def format_markdown_timestamp(
 
     parsed = parse_iso_timestamp(value)
     if not parsed:
-        try:
-            normalized = value.replace("Z", "+00:00")
-            parsed = datetime.fromisoformat(normalized)
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-        except ValueError:
-            if default == "Unknown time":
-                return default
-            return value
-
-    localized = to_local(parsed) or parsed.astimezone()
+        if default == "Unknown time":
+            return default
+        return value
+
+    localized = to_local(parsed)
 
     month = localized.strftime("%b")
     day = localized.day
@@ -203,12 +178,12 @@ def suggest_export_filename(metadata: Dict[str, Any], conversation_id: str) -> s
     timestamp_source = metadata.get("started_at") or metadata.get("updated_at")
     parsed = parse_iso_timestamp(timestamp_source)
     if parsed:
-        localized = to_local(parsed) or parsed.astimezone()
+        localized = to_local(parsed)
         date_part = localized.strftime("%Y%m%d")
         time_part = localized.strftime("%H%M")
         base = f"{date_part}-{time_part}"
     else:
-        base = datetime.now(timezone.utc).astimezone().strftime("%Y%m%d")
+        base = local_now().strftime("%Y%m%d")
 
     safe_id = "".join(ch for ch in conversation_id if ch.isalnum())[:8]
     suffix = f"-{safe_id}" if safe_id else ""
@@ -218,13 +193,22 @@ def suggest_export_filename(metadata: Dict[str, Any], conversation_id: str) -> s
 def load_conversation_thread(
     db: Session, conversation_id: str
 ) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
-    records = (
-        db.query(models.Conversation)
-        .order_by(models.Conversation.created_at.asc())
-        .all()
+    conversation = models.Conversation
+    records = db.execute(
+        select(
+            conversation.id,
+            conversation.session_type,
+            conversation.conversation_uuid,
+            conversation.messages,
+            conversation.thinking_log,
+            conversation.created_at,
+        )
+        .where(conversation.conversation_uuid == conversation_id)
+        .order_by(conversation.created_at.asc())
     )
 
-    transcript: List[Dict[str, Any]] = []
+    # (sort key, entry) pairs; each record's timestamp is parsed exactly once.
+    keyed_entries: List[Tuple[datetime, Dict[str, Any]]] = []
     session_types: set[str] = set()
     started_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
@@ -234,19 +218,12 @@ def load_conversation_thread(
         if not record.messages:
             continue
 
-        try:
-            messages = json.loads(record.messages)
-        except json.JSONDecodeError:
-            messages = {}
-
-        record_conversation_id = conversation_id_for_record(record, messages)
-        if record_conversation_id != conversation_id:
-            continue
+        messages = record.messages
 
         timestamp_iso = message_timestamp(messages, record)
-        timestamp_dt = parse_iso_timestamp(timestamp_iso) or to_local(
-            record.created_at
-        )
+        parsed_timestamp = parse_iso_timestamp(timestamp_iso)
+        timestamp_dt = parsed_timestamp or to_local(record.created_at)
+        sort_key = parsed_timestamp or _EARLIEST
 
         if timestamp_dt:
             if started_at is None or timestamp_dt < started_at:
@@ -263,43 +240,39 @@ def load_conversation_thread(
         catalyst_text = (messages.get("catalyst") or "").strip()
 
         if user_text:
-            transcript.append(
-                {
-                    "role": "user",
-                    "content": user_text,
-                    "timestamp": timestamp_iso,
-                    "session_type": record.session_type,
-                    "message_id": record.id,
-                    "conversation_id": record_conversation_id,
-                }
-            )
+            user_entry = {
+                "role": "user",
+                "content": user_text,
+                "timestamp": timestamp_iso,
+                "session_type": record.session_type,
+                "message_id": record.id,
+                "conversation_id": record.conversation_uuid,
+            }
+            keyed_entries.append((sort_key, user_entry))
 
         if catalyst_text:
-            transcript.append(
-                {
-                    "role": "catalyst",
-                    "content": catalyst_text,
-                    "timestamp": timestamp_iso,
-                    "session_type": record.session_type,
-                    "model": messages.get("model"),
-                    "thinking": record.thinking_log or None,
-                    "function_calls": messages.get("function_calls", []),
-                    "system_prompt": messages.get("system_prompt"),
-                    "system_prompt_reference": messages.get("system_prompt_reference"),
-                    "context_snapshot": messages.get("context_snapshot"),
-                    "context_reference": messages.get("context_reference"),
-                    "message_id": record.id,
-                    "conversation_id": record_conversation_id,
-                }
-            )
+            catalyst_entry = {
+                "role": "catalyst",
+                "content": catalyst_text,
+                "timestamp": timestamp_iso,
+                "session_type": record.session_type,
+                "model": messages.get("model"),
+                "thinking": record.thinking_log or None,
+                "function_calls": messages.get("function_calls", []),
+                "system_prompt": messages.get("system_prompt"),
+                "system_prompt_reference": messages.get("system_prompt_reference"),
+                "context_snapshot": messages.get("context_snapshot"),
+                "context_reference": messages.get("context_reference"),
+                "message_id": record.id,
+                "conversation_id": record.conversation_uuid,
+            }
+            keyed_entries.append((sort_key, catalyst_entry))
 
     if message_count == 0:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    transcript.sort(
-        key=lambda item: parse_iso_timestamp(item.get("timestamp"))
-        or datetime.min.replace(tzinfo=timezone.utc)
-    )
+    keyed_entries.sort(key=itemgetter(0))
+    transcript = [entry for _, entry in keyed_entries]
 
     metadata = {
         "message_count": message_count,
@@ -311,18 +284,6 @@ def load_conversation_thread(
     return transcript, metadata
 
 
-def serialize_goal_record(goal: models.Goal) -> Dict[str, Any]:
-    created_at_local = to_local(goal.created_at) if goal.created_at else None
-    return {
-        "id": goal.id,
-        "description": goal.description,
-        "metric": goal.metric,
-        "timeline": goal.timeline,
-        "rank": goal.rank,
-        "created_at": created_at_local.isoformat() if created_at_local else None,
-    }
-
-
 def build_context_reference(
     sources: List[Dict[str, Any]],
     goals: List[Dict[str, Any]],
@@ -374,14 +335,22 @@ def reconstruct_context_from_reference(
         if item.get("type") == "record" and item.get("id") is not None
     ]
 
-    records_map: Dict[int, models.Conversation] = {}
+    # Read-only columns as plain rows; no ORM hydration for the referenced turns.
+    records_map: Dict[int, Row] = {}
     if record_ids:
-        records = (
-            db.query(models.Conversation)
-            .filter(models.Conversation.id.in_(record_ids))
-            .all()
-        )
-        records_map = {record.id: record for record in records}
+        conversation = models.Conversation
+        records_map = {
+            row.id: row
+            for row in db.execute(
+                select(
+                    conversation.id,
+                    conversation.session_type,
+                    conversation.conversation_uuid,
+                    conversation.messages,
+                    conversation.created_at,
+                ).where(conversation.id.in_(record_ids))
+            )
+        }
 
     recent_entries: List[Dict[str, Any]] = []
     for item in sequence:
@@ -391,18 +360,14 @@ def reconstruct_context_from_reference(
             record = records_map.get(record_id)
             if not record or not record.messages:
                 continue
-            try:
-                payload = json.loads(record.messages)
-            except json.JSONDecodeError:
-                payload = {}
+            payload = record.messages
 
             entry: Dict[str, Any] = {
                 "session_type": record.session_type,
                 "user": (payload.get("user") or ""),
                 "catalyst": (payload.get("catalyst") or ""),
-                "timestamp": payload.get("timestamp")
-                or message_timestamp(payload, record),
-                "conversation_id": conversation_id_for_record(record, payload),
+                "timestamp": message_timestamp(payload, record),
+                "conversation_id": record.conversation_uuid,
             }
             if payload.get("initial_greeting"):
                 entry["initial_greeting"] = True
@@ -422,7 +387,7 @@ def reconstruct_context_from_reference(
         for goal_id in goal_ids:
             goal_record = goal_map.get(goal_id)
             if goal_record:
-                goals.append(serialize_goal_record(goal_record))
+                goals.append(serialize_goal_row(goal_record))
 
     if not goals:
         goals = get_goals_hierarchy(db)
@@ -473,7 +438,7 @@ def build_conversation_filename(
     timestamp = parse_iso_timestamp(timestamp_source) if timestamp_source else None
     if not timestamp:
         timestamp = utc_now()
-    local_timestamp = timestamp.astimezone()
+    local_timestamp = to_local(timestamp)
     stamp = local_timestamp.strftime("%Y%m%d-%H%M")
     safe_fragment = re.sub(r"[^a-zA-Z0-9]+", "-", conversation_id).strip("-")
     if not safe_fragment:
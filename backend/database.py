@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import threading
 import time
 import uuid
 from contextlib import contextmanager
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterator, Optional
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
 
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.exc import OperationalError
@@ -17,6 +16,7 @@ from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmak
 from sqlalchemy.pool import StaticPool
 
 from .config import DATABASE_URL
+from .time_utils import parse_iso_timestamp
 
 
 def _session_scope_identifier() -> Any:
@@ -34,11 +34,20 @@ def _session_scope_identifier() -> Any:
 
 
 engine_kwargs: Dict[str, Any] = {"pool_pre_ping": True}
+# Routes fan out up to five concurrent reads via run_in_session on top of the
+# request's own session, so bursts need more than the default 5 + 10.
+_POOL_KWARGS: Dict[str, Any] = {
+    "pool_size": 20,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+}
 
 if DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False, "timeout": 30}
     if ":memory:" in DATABASE_URL:
         engine_kwargs["poolclass"] = StaticPool
+    else:
+        engine_kwargs.update(_POOL_KWARGS)
 
     engine = create_engine(DATABASE_URL, connect_args=connect_args, **engine_kwargs)
 
@@ -50,16 +59,51 @@ if DATABASE_URL.startswith("sqlite"):
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.execute("PRAGMA busy_timeout=30000")
         cursor.close()
+
+    if ":memory:" in DATABASE_URL:
+        # A second engine would open a separate, empty in-memory database.
+        read_engine = engine
+    else:
+        # Autocommit readers take no long-lived read transaction, so each
+        # query sees the latest WAL snapshot and never queues behind /chat's
+        # write transaction; query_only rejects accidental writes.
+        read_engine = create_engine(
+            DATABASE_URL,
+            connect_args=connect_args,
+            isolation_level="AUTOCOMMIT",
+            **engine_kwargs,
+        )
+
+        @event.listens_for(read_engine, "connect")
+        def _set_sqlite_read_pragma(dbapi_connection, connection_record):  # type: ignore[override]
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA query_only=ON")
+            cursor.execute("PRAGMA busy_timeout=30000")
+            cursor.close()
 else:
+    # Server databases drop idle connections; recycle before that happens.
+    engine_kwargs.update(_POOL_KWARGS, pool_recycle=1800)
     engine = create_engine(DATABASE_URL, **engine_kwargs)
+    read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+_session_factory = sessionmaker(
+    bind=engine, autocommit=False, autoflush=False, expire_on_commit=False
+)
+
+SessionLocal = scoped_session(_session_factory, scopefunc=_session_scope_identifier)
 
-SessionLocal = scoped_session(
-    sessionmaker(
-        bind=engine, autocommit=False, autoflush=False, expire_on_commit=False
-    ),
-    scopefunc=_session_scope_identifier,
+ReadSessionLocal = sessionmaker(
+    bind=read_engine, autocommit=False, autoflush=False, expire_on_commit=False
 )
 
+# In-memory databases hand every session the same DBAPI connection, so worker
+# jobs against them must take turns.
+_shared_connection_lock: Optional[threading.Lock] = (
+    threading.Lock() if ":memory:" in DATABASE_URL else None
+)
+
+_T = TypeVar("_T")
+
 _MAX_COMMIT_RETRIES = 5
 _RETRY_BACKOFF_SECONDS = 0.2
 
@@ -73,20 +117,54 @@ def init_database() -> None:
 
     models.Base.metadata.create_all(bind=engine)
     _ensure_conversation_schema()
+    _ensure_daily_log_schema()
 
 
 def _ensure_conversation_schema() -> None:
-    """Ensure conversation table has dedicated UUID column and backfilled data."""
+    """Ensure conversation table has its added columns, indexes, and backfilled data."""
 
     with engine.begin() as connection:
-        columns = connection.execute(text("PRAGMA table_info(conversations)"))
-        has_uuid_column = any(row[1] == "conversation_uuid" for row in columns)
-        if not has_uuid_column:
+        columns = {
+            row[1]
+            for row in connection.execute(text("PRAGMA table_info(conversations)"))
+        }
+        if "conversation_uuid" not in columns:
             connection.execute(
                 text(
                     "ALTER TABLE conversations ADD COLUMN conversation_uuid VARCHAR(64)"
                 )
             )
+        if "is_initial_greeting" not in columns:
+            connection.execute(
+                text(
+                    "ALTER TABLE conversations "
+                    "ADD COLUMN is_initial_greeting BOOLEAN NOT NULL DEFAULT 0"
+                )
+            )
+            connection.execute(
+                text(
+                    "UPDATE conversations SET is_initial_greeting = 1 "
+                    "WHERE json_valid(messages) "
+                    "AND json_extract(messages, '$.initial_greeting')"
+                )
+            )
+        # create_all() only indexes tables it creates; older files need these added.
+        # The (conversation_uuid, created_at) index also serves uuid-only lookups.
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_conversations_uuid_created_at "
+                "ON conversations (conversation_uuid, created_at)"
+            )
+        )
+        connection.execute(
+            text("DROP INDEX IF EXISTS ix_conversations_conversation_uuid")
+        )
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_conversations_created_at "
+                "ON conversations (created_at)"
+            )
+        )
 
     from .models import Conversation  # imported lazily to avoid circular import
 
@@ -103,17 +181,59 @@ def _ensure_conversation_schema() -> None:
         SessionLocal.remove()
 
 
-def _parse_iso(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    normalized = value.replace("Z", "+00:00")
-    try:
-        parsed = datetime.fromisoformat(normalized)
-    except ValueError:
-        return None
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-    return parsed
+_DAILY_LOG_FLAG_COLUMNS = ("morning_completed", "evening_completed")
+
+
+def _ensure_daily_log_schema() -> None:
+    """Collapse duplicate daily logs so each date is unique, then index it."""
+
+    with engine.begin() as connection:
+        duplicate_dates = (
+            connection.execute(
+                text(
+                    "SELECT date FROM daily_logs WHERE date IS NOT NULL "
+                    "GROUP BY date HAVING COUNT(*) > 1"
+                )
+            )
+            .scalars()
+            .all()
+        )
+        for day in duplicate_dates:
+            rows = (
+                connection.execute(
+                    text("SELECT * FROM daily_logs WHERE date = :day ORDER BY id"),
+                    {"day": day},
+                )
+                .mappings()
+                .all()
+            )
+            keep_id = rows[0]["id"]
+            merged: Dict[str, Any] = {}
+            for row in rows:
+                for column, value in row.items():
+                    if column in {"id", "date", "created_at"}:
+                        continue
+                    if column in _DAILY_LOG_FLAG_COLUMNS:
+                        merged[column] = bool(merged.get(column) or value)
+                    elif value is not None:
+                        merged[column] = value
+
+            assignments = ", ".join(f"{column} = :{column}" for column in merged)
+            connection.execute(
+                text(f"UPDATE daily_logs SET {assignments} WHERE id = :keep_id"),
+                {**merged, "keep_id": keep_id},
+            )
+            connection.execute(
+                text("DELETE FROM daily_logs WHERE date = :day AND id != :keep_id"),
+                {"day": day, "keep_id": keep_id},
+            )
+
+        connection.execute(
+            text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_daily_logs_date "
+                "ON daily_logs (date)"
+            )
+        )
 
 
 def _backfill_conversation_threads(session: Session) -> None:
@@ -133,20 +253,14 @@ def _backfill_conversation_threads(session: Session) -> None:
     updates: int = 0
 
     for record in records:
-        payload: Dict[str, Any]
-        if not record.messages:
-            payload = {}
-        else:
-            try:
-                payload = json.loads(record.messages)
-            except json.JSONDecodeError:
-                payload = {"_invalid_json": record.messages}
+        # Copy so the reassignment below registers as a change on flush.
+        payload: Dict[str, Any] = dict(record.messages or {})
 
         explicit_uuid = payload.get("conversation_id") or record.conversation_uuid
         if explicit_uuid:
             conversation_uuid = str(explicit_uuid)
         else:
-            message_timestamp = _parse_iso(payload.get("timestamp"))
+            message_timestamp = parse_iso_timestamp(payload.get("timestamp"))
             created_at = (
                 record.created_at if isinstance(record.created_at, datetime) else None
             )
@@ -175,10 +289,10 @@ def _backfill_conversation_threads(session: Session) -> None:
 
         if payload.get("conversation_id") != conversation_uuid:
             payload["conversation_id"] = conversation_uuid
-            record.messages = json.dumps(payload)
+            record.messages = payload
             updates += 1
 
-        timestamp_value = _parse_iso(payload.get("timestamp")) or (
+        timestamp_value = parse_iso_timestamp(payload.get("timestamp")) or (
             record.created_at if isinstance(record.created_at, datetime) else None
         )
 
@@ -190,6 +304,30 @@ def _backfill_conversation_threads(session: Session) -> None:
         session.commit()
 
 
+async def run_in_session(fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run ``fn(session, *args, **kwargs)`` on a worker thread with its own session.
+
+    Keeps blocking ORM reads off the event loop; independent calls can be
+    awaited together with ``asyncio.gather`` and use separate pooled connections.
+    Returned ORM objects are detached but keep their loaded attributes.
+    """
+
+    def _call() -> _T:
+        session: Session = _session_factory()
+        try:
+            return fn(session, *args, **kwargs)
+        finally:
+            session.close()
+
+    def _call_serialized() -> _T:
+        with _shared_connection_lock:  # type: ignore[union-attr]
+            return _call()
+
+    if _shared_connection_lock is None:
+        return await asyncio.to_thread(_call)
+    return await asyncio.to_thread(_call_serialized)
+
+
 @contextmanager
 def get_session() -> Iterator[Session]:
     """Provide a transactional scope around a series of operations."""
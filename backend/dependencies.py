@@ -6,7 +6,7 @@ from typing import Generator
 
 from sqlalchemy.orm import Session
 
-from .database import SessionLocal
+from .database import ReadSessionLocal, SessionLocal
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -15,3 +15,13 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """Session for GET routes that never write; see ``database.read_engine``."""
+
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Any, Dict, Tuple
 
+import orjson
 import toons
 
 from .config import ENVELOPE_FORMAT
@@ -118,8 +118,8 @@ def normalize_envelope(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def _parse_json_envelope(text: str) -> Dict[str, Any] | None:
     try:
-        data = json.loads(text)
-    except json.JSONDecodeError:
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
         return None
     if isinstance(data, dict):
         return normalize_envelope(data)
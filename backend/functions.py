@@ -6,9 +6,10 @@ import re
 from typing import Any, Callable, Dict, List, Optional
 
 from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from .database import get_session
-from .models import DailyLog, Insight, LTMProfile, SessionTracking
+from .models import DailyLog, Insight, LTMProfile
 from .time_utils import local_today, to_local, utc_now
 
 catalyst_functions: Dict[str, Callable[..., Any]] = {}
@@ -116,22 +117,20 @@ def log_daily_reflection(
     focus_rating: int = 5,
 ) -> Dict[str, Any]:
     """Log daily reflection data to the database."""
+    values = {
+        "wins": wins,
+        "challenges": challenges,
+        "gratitude": gratitude,
+        "next_day_priorities": priorities,
+        "energy_level": energy_level,
+        "focus_rating": focus_rating,
+    }
+    stmt = sqlite_insert(DailyLog).values(date=local_today(), **values)
     with get_session() as session:
-        log = (
-            session.query(DailyLog).filter(DailyLog.date == local_today()).one_or_none()
+        session.execute(
+            stmt.on_conflict_do_update(index_elements=[DailyLog.date], set_=values)
         )
 
-        if not log:
-            log = DailyLog(date=local_today())
-            session.add(log)
-
-        log.wins = wins
-        log.challenges = challenges
-        log.gratitude = gratitude
-        log.next_day_priorities = priorities
-        log.energy_level = energy_level
-        log.focus_rating = focus_rating
-
     return {"status": "success", "message": "Daily reflection logged successfully"}
 
 
@@ -234,26 +233,10 @@ def update_session_tracking(session_type: str) -> Dict[str, Any]:
     """Update session tracking information for morning/evening check-ins."""
     now_utc = utc_now()
 
-    with get_session() as session:
-        tracking = (
-            session.query(SessionTracking).order_by(SessionTracking.id.desc()).first()
-        )
-
-        if not tracking:
-            tracking = SessionTracking(streak_count=0, total_sessions=0)
-            session.add(tracking)
-            session.flush()
-
-        if session_type == "morning":
-            tracking.last_morning_session = now_utc
-        elif session_type == "evening":
-            tracking.last_evening_session = now_utc
-
-        tracking.total_sessions = (tracking.total_sessions or 0) + 1
+    from .memory_manager import record_session_tracking
 
-        from .memory_manager import compute_streak
-
-        tracking.streak_count = compute_streak(session)
+    with get_session() as session:
+        record_session_tracking(session, session_type, now_utc)
 
     return {
         "status": "success",
@@ -3,14 +3,135 @@
 from __future__ import annotations
 
 import re
+import threading
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Any, Dict, List, Optional, Sequence
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from sqlalchemy import desc, event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from .models import (
+    Conversation,
+    DailyLog,
+    Goal,
+    Insight,
+    LTMProfile,
+    SessionTracking,
+)
+from .time_utils import ensure_utc, local_now, to_local
 
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+# ---------------------------------------------------------------------------
+# In-process cache for context that every chat turn reloads (LTM profile,
+# goal hierarchy, top insights) and for the read-mostly GET routes the
+# frontend polls. Entries expire after a short TTL and are dropped as soon as
+# any session commits a change to a backing table. Cached values are shared
+# between requests: treat them as read-only.
+# ---------------------------------------------------------------------------
 
-from .models import DailyLog, Goal, Insight, LTMProfile, SessionTracking
-from .time_utils import ensure_utc, local_now, to_local
+CONTEXT_CACHE_TTL_SECONDS = 60.0
+
+# Keyed by table name so tests that reload ``backend.models`` still match.
+_CACHE_KEYS_BY_TABLE: Dict[str, Tuple[str, ...]] = {
+    LTMProfile.__tablename__: ("ltm_profile",),
+    Goal.__tablename__: ("goals",),
+    Insight.__tablename__: ("insights", "insight_list"),
+    DailyLog.__tablename__: ("recent_logs", "stats"),
+    SessionTracking.__tablename__: ("stats",),
+    Conversation.__tablename__: ("recent_conversations",),
+}
+_PENDING_INVALIDATIONS = "catalyst_context_cache_invalidations"
+
+_context_cache: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+_context_cache_generation: Dict[str, int] = {}
+_context_cache_lock = threading.Lock()
+
+_T = TypeVar("_T")
+
+
+def cached_context(key: str, loader: Callable[[], _T], variant: Hashable = None) -> _T:
+    """Return ``loader()`` through the context cache.
+
+    ``variant`` separates entries under one key (e.g. query parameters); a
+    commit to a backing table drops every variant of its keys.
+    """
+
+    now = monotonic()
+    with _context_cache_lock:
+        cached = _context_cache.get((key, variant))
+        if cached and now - cached[0] < CONTEXT_CACHE_TTL_SECONDS:
+            return cached[1]
+        generation = _context_cache_generation.get(key, 0)
+
+    value = loader()
+
+    with _context_cache_lock:
+        # Skip the store if a commit invalidated the key while we were loading.
+        if _context_cache_generation.get(key, 0) == generation:
+            _context_cache[(key, variant)] = (now, value)
+    return value
+
+
+def invalidate_context_cache(*keys: str) -> None:
+    """Drop cached context entries (all of them when no key is given)."""
+
+    dropped = set(keys) or {
+        key for table_keys in _CACHE_KEYS_BY_TABLE.values() for key in table_keys
+    }
+    with _context_cache_lock:
+        for entry in [entry for entry in _context_cache if entry[0] in dropped]:
+            del _context_cache[entry]
+        for key in dropped:
+            _context_cache_generation[key] = _context_cache_generation.get(key, 0) + 1
+
+
+def _mark_pending(session: Session, classes: Any) -> None:
+    tables = {getattr(cls, "__tablename__", None) for cls in classes}
+    keys = {
+        key
+        for table in tables
+        if table in _CACHE_KEYS_BY_TABLE
+        for key in _CACHE_KEYS_BY_TABLE[table]
+    }
+    if keys:
+        session.info.setdefault(_PENDING_INVALIDATIONS, set()).update(keys)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_context(session: Session, _flush_context: Any) -> None:
+    _mark_pending(
+        session,
+        {type(obj) for obj in (*session.new, *session.dirty, *session.deleted)},
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_context(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        _mark_pending(state.session, {mapper.class_ for mapper in state.all_mappers})
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_context(session: Session) -> None:
+    keys = session.info.pop(_PENDING_INVALIDATIONS, None)
+    if keys:
+        invalidate_context_cache(*keys)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_context(session: Session, _previous_transaction: Any) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
 
 
 def serialize_ltm_profile(profile: Optional[LTMProfile]) -> Dict[str, Any]:
@@ -63,20 +184,33 @@ def _serialize_insight_row(insight: Insight) -> Dict[str, Any]:
     }
 
 
-def get_recent_insights(session: Session, limit: int = 8) -> List[Dict[str, Any]]:
-    """Return the most relevant stored insights for contextual priming."""
+RECENT_INSIGHTS_LIMIT = 8
+
 
-    insights = (
-        session.query(Insight)
-        .order_by(
-            Insight.importance_score.desc(),
-            Insight.date_identified.desc(),
-            Insight.id.desc(),
+def get_recent_insights(
+    session: Session, limit: int = RECENT_INSIGHTS_LIMIT
+) -> List[Dict[str, Any]]:
+    """Return the most relevant stored insights for contextual priming.
+
+    The default-sized list is served from the context cache.
+    """
+
+    def _load() -> List[Dict[str, Any]]:
+        insights = (
+            session.query(Insight)
+            .order_by(
+                Insight.importance_score.desc(),
+                Insight.date_identified.desc(),
+                Insight.id.desc(),
+            )
+            .limit(limit)
+            .all()
         )
-        .limit(limit)
-        .all()
-    )
-    return [_serialize_insight_row(insight) for insight in insights]
+        return [_serialize_insight_row(insight) for insight in insights]
+
+    if limit != RECENT_INSIGHTS_LIMIT:
+        return _load()
+    return cached_context("insights", _load)
 
 
 def get_insights_by_ids(
@@ -118,9 +252,13 @@ def compress_old_memories(text: str, age_days: int) -> str:
 
 
 def get_current_ltm_profile(session: Session) -> Dict[str, Any]:
-    """Retrieve the latest long-term memory profile."""
-    profile = session.query(LTMProfile).order_by(desc(LTMProfile.version)).first()
-    return serialize_ltm_profile(profile)
+    """Retrieve the latest long-term memory profile (cached, read-only)."""
+
+    def _load() -> Dict[str, Any]:
+        profile = session.query(LTMProfile).order_by(desc(LTMProfile.version)).first()
+        return serialize_ltm_profile(profile)
+
+    return cached_context("ltm_profile", _load)
 
 
 def get_ltm_profile_by_id(
@@ -172,14 +310,18 @@ def serialize_goal_row(goal: Goal) -> Dict[str, Any]:
 
 
 def get_goals_hierarchy(session: Session) -> List[Dict[str, Any]]:
-    """Return all active goals ordered by rank and recency."""
-    goals = (
-        session.query(Goal)
-        .filter(Goal.is_active.is_(True))
-        .order_by(Goal.rank.asc(), Goal.created_at.desc())
-        .all()
-    )
-    return [serialize_goal_row(goal) for goal in goals]
+    """Return all active goals ordered by rank and recency (cached, read-only)."""
+
+    def _load() -> List[Dict[str, Any]]:
+        goals = (
+            session.query(Goal)
+            .filter(Goal.is_active.is_(True))
+            .order_by(Goal.rank.asc(), Goal.created_at.desc())
+            .all()
+        )
+        return [serialize_goal_row(goal) for goal in goals]
+
+    return cached_context("goals", _load)
 
 
 def sync_ltm_north_star(
@@ -222,6 +364,54 @@ def _day_has_ritual_activity(log: Optional[DailyLog]) -> bool:
     return bool(log.morning_completed or log.evening_completed)
 
 
+_RITUAL_LOG_FIELDS = {
+    "morning": ("morning_completed", "morning_intention"),
+    "evening": ("evening_completed", "evening_reflection"),
+}
+
+
+def record_ritual_log(
+    session: Session, session_type: str, text: str, day: Optional[date] = None
+) -> None:
+    """Upsert the day's ``DailyLog`` row for a completed morning/evening ritual."""
+
+    fields = _RITUAL_LOG_FIELDS.get(session_type)
+    if fields is None:
+        return
+
+    completed_field, text_field = fields
+    values = {completed_field: True, text_field: text}
+    stmt = sqlite_insert(DailyLog).values(date=day or local_now().date(), **values)
+    session.execute(
+        stmt.on_conflict_do_update(index_elements=[DailyLog.date], set_=values)
+    )
+
+
+def record_session_tracking(
+    session: Session, session_type: str, now_utc: datetime
+) -> None:
+    """Count a check-in on the latest ``SessionTracking`` row and refresh its streak.
+
+    Call after ``record_ritual_log`` in the same transaction so the streak
+    includes today's log.
+    """
+
+    tracking = (
+        session.query(SessionTracking).order_by(SessionTracking.id.desc()).first()
+    )
+    if not tracking:
+        tracking = SessionTracking(streak_count=0, total_sessions=0)
+        session.add(tracking)
+
+    if session_type == "morning":
+        tracking.last_morning_session = now_utc
+    elif session_type == "evening":
+        tracking.last_evening_session = now_utc
+
+    tracking.total_sessions = (tracking.total_sessions or 0) + 1
+    tracking.streak_count = compute_streak(session)
+
+
 def compute_streak(session: Session) -> int:
     """Count consecutive calendar days with at least one ritual completed."""
     today = local_now().date()
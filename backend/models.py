@@ -3,16 +3,46 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
+from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Integer, String, Text
+import orjson
+from sqlalchemy import Boolean, Column, Date, DateTime, Index, Integer, String, Text
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 
 from .database import Base
 
 
+class JSONPayload(TypeDecorator):
+    """JSON object stored as TEXT, decoded once at fetch time with orjson.
+
+    Rows that predate the typed column may hold malformed text; those load as
+    ``{"_invalid_json": raw}`` so a single bad row never breaks a query.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return orjson.dumps(value).decode()
+
+    def process_result_value(self, value: Any, dialect: Any) -> Optional[Any]:
+        if value is None:
+            return None
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return {"_invalid_json": value}
+
+
 class Goal(Base):
     __tablename__ = "goals"
+    # Load the server-side created_at on INSERT so new rows serialize without a
+    # refresh SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int = Column(Integer, primary_key=True, index=True)
     description: str = Column(Text, nullable=False)
@@ -29,6 +59,7 @@ class Goal(Base):
 
 class DailyLog(Base):
     __tablename__ = "daily_logs"
+    __table_args__ = (Index("uq_daily_logs_date", "date", unique=True),)
 
     id: int = Column(Integer, primary_key=True, index=True)
     date: datetime = Column(Date, server_default=func.date("now"))
@@ -49,6 +80,8 @@ class DailyLog(Base):
 
 class LTMProfile(Base):
     __tablename__ = "ltm_profile"
+    # Load the server-side last_updated on INSERT, as for Goal.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int = Column(Integer, primary_key=True, index=True)
     summary_text: str = Column(Text, nullable=False)
@@ -66,14 +99,22 @@ class LTMProfile(Base):
 
 class Conversation(Base):
     __tablename__ = "conversations"
+    __table_args__ = (
+        Index("ix_conversations_uuid_created_at", "conversation_uuid", "created_at"),
+    )
 
     id: int = Column(Integer, primary_key=True, index=True)
-    conversation_uuid: Optional[str] = Column(String(64), index=True)
+    conversation_uuid: str = Column(
+        String(64), nullable=False, default=lambda: str(uuid4())
+    )
     session_type: Optional[str] = Column(String(50))
-    messages: Optional[str] = Column(Text)
+    messages: Optional[Dict[str, Any]] = Column(JSONPayload)
+    is_initial_greeting: bool = Column(
+        Boolean, nullable=False, default=False, server_default="0"
+    )
     thinking_log: Optional[str] = Column(Text)
     created_at: datetime = Column(
-        DateTime(timezone=True), server_default=func.current_timestamp()
+        DateTime(timezone=True), server_default=func.current_timestamp(), index=True
     )
 
 
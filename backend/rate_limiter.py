@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import math
 import time
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Deque, Dict, Optional
+from typing import Deque, Dict, Iterable, Optional
 
 from .config import MODEL_RATE_LIMITS
 
 _TOKEN_WINDOW_SECONDS = 60.0
 _DAY_WINDOW_SECONDS = 86_400.0
 
+# Characters-per-token ratio for estimate_tokens, tuned by provider feedback.
+_CALIBRATION_ALPHA = 0.05
+_MIN_CHARS_PER_TOKEN = 1.5
+_MAX_CHARS_PER_TOKEN = 8.0
+_chars_per_token = 4.0
+_chars_per_token_dev = 0.0
+
 
 @dataclass
 class _ModelState:
@@ -25,6 +33,18 @@ class _ModelState:
     cooldown_until: float = 0.0
 
 
+@dataclass(frozen=True)
+class ModelUsage:
+    """Point-in-time usage counts for one model's quota windows."""
+
+    minute_requests: int
+    minute_tokens: int
+    day_requests: int
+    minute_requests_reset_in: float
+    minute_tokens_reset_in: float
+    day_requests_reset_in: float
+
+
 class RateLimiter:
     """Rate limiter that enforces per-model quotas for LLM usage."""
 
@@ -103,19 +123,29 @@ class RateLimiter:
     ) -> float:
         """Return the expected wait time before a request can be made."""
 
-        limits = self._limits.get(model)
-        if not limits:
-            return 0.0
+        waits = await self.get_wait_times((model,), estimated_prompt_tokens)
+        return waits[model]
 
-        reserve = max(0, int(estimated_prompt_tokens))
+    async def get_wait_times(
+        self, models: Iterable[str], estimated_prompt_tokens: int = 0
+    ) -> Dict[str, float]:
+        """Return the expected wait time for each model in a single call."""
 
-        async with self._get_lock(model):
-            state = self._get_state(model)
-            now = time.monotonic()
-            self._prune_requests(state, now)
-            if limits.get("tpm"):
-                self._prune_tokens(state, now)
-            return self._compute_wait_time(state, now, limits, reserve)
+        reserve = max(0, int(estimated_prompt_tokens))
+        waits: Dict[str, float] = {}
+        for model in models:
+            limits = self._limits.get(model)
+            if not limits:
+                waits[model] = 0.0
+                continue
+            async with self._get_lock(model):
+                state = self._get_state(model)
+                now = time.monotonic()
+                self._prune_requests(state, now)
+                if limits.get("tpm"):
+                    self._prune_tokens(state, now)
+                waits[model] = self._compute_wait_time(state, now, limits, reserve)
+        return waits
 
     async def wait_for_request(
         self, model: str, estimated_prompt_tokens: int = 0
@@ -200,16 +230,65 @@ class RateLimiter:
             now = time.monotonic()
             state.cooldown_until = max(state.cooldown_until, now + delay_seconds)
 
+    async def snapshot(self) -> Dict[str, ModelUsage]:
+        """Prune each tracked model's windows and report what remains in them."""
+
+        usage: Dict[str, ModelUsage] = {}
+        for model in list(self._states):
+            async with self._get_lock(model):
+                state = self._states[model]
+                now = time.monotonic()
+                self._prune_requests(state, now)
+                self._prune_tokens(state, now)
+                usage[model] = ModelUsage(
+                    minute_requests=len(state.minute_requests),
+                    minute_tokens=state.token_sum,
+                    day_requests=len(state.day_requests),
+                    minute_requests_reset_in=(
+                        state.minute_requests[0] + _TOKEN_WINDOW_SECONDS - now
+                        if state.minute_requests
+                        else 0.0
+                    ),
+                    minute_tokens_reset_in=(
+                        state.token_events[0][0] + _TOKEN_WINDOW_SECONDS - now
+                        if state.token_events
+                        else 0.0
+                    ),
+                    day_requests_reset_in=(
+                        state.day_requests[0] + _DAY_WINDOW_SECONDS - now
+                        if state.day_requests
+                        else 0.0
+                    ),
+                )
+        return usage
+
 
 def estimate_tokens(*segments: Optional[str]) -> int:
-    """Crude token estimation using character length heuristics."""
+    """Estimate tokens from character length using the calibrated ratio."""
 
     combined = " ".join(segment for segment in segments if segment)
     if not combined:
         return 0
-    # Rough heuristic: 4 characters ~= 1 token
-    estimated = max(1, len(combined) // 4)
-    return estimated
+    # Err high: divide by the ratio less its typical deviation.
+    ratio = max(_MIN_CHARS_PER_TOKEN, _chars_per_token - _chars_per_token_dev)
+    return max(1, math.ceil(len(combined) / ratio))
+
+
+def calibrate_token_estimate(prompt_chars: int, prompt_tokens: Optional[int]) -> None:
+    """Fold a provider-reported prompt token count into the estimate ratio."""
+
+    global _chars_per_token, _chars_per_token_dev
+
+    if not prompt_chars or not prompt_tokens or prompt_tokens <= 0:
+        return
+    observed = min(
+        _MAX_CHARS_PER_TOKEN,
+        max(_MIN_CHARS_PER_TOKEN, prompt_chars / prompt_tokens),
+    )
+    _chars_per_token_dev += _CALIBRATION_ALPHA * (
+        abs(observed - _chars_per_token) - _chars_per_token_dev
+    )
+    _chars_per_token += _CALIBRATION_ALPHA * (observed - _chars_per_token)
 
 
 rate_limiter = RateLimiter(MODEL_RATE_LIMITS)
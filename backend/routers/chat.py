@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-import json
-from datetime import timedelta
+import asyncio
+import hashlib
+import logging
+from collections import deque
+from datetime import date, datetime, timedelta
 from math import ceil
-from typing import Any, Dict, List, Optional
+from string import Template
+from time import monotonic
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import Row, case, func, select
 from sqlalchemy.orm import Session
 
 from .. import models
@@ -17,24 +24,248 @@ from ..config import SHOW_THINKING
 from ..conversation import (
     RECENT_CONVERSATION_CHAR_LIMIT,
     build_context_reference,
-    conversation_id_for_record,
-    parse_iso_timestamp,
-    serialize_goal_record,
 )
+from ..database import run_in_session
 from ..dependencies import get_db
-from ..functions import update_session_tracking
 from ..memory_manager import (
     check_for_missed_sessions,
     get_current_ltm_profile,
     get_goals_hierarchy,
-    get_ltm_profile_by_id,
     get_recent_insights,
+    record_ritual_log,
+    record_session_tracking,
+    serialize_goal_row,
+    serialize_ltm_profile,
 )
+from ..rate_limiter import estimate_tokens
 from ..schemas import ChatMessage, ChatResponse, Goal, GreetingRequest, SessionType
-from ..time_utils import local_now, local_today, to_local, utc_now
+from ..time_utils import local_now, local_today, parse_iso_timestamp, to_local, utc_now
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+RECENT_CONVERSATION_WINDOW = timedelta(hours=48)
+# Upper bound on rows /chat pulls before its character-budget trim; far more
+# than RECENT_CONVERSATION_CHAR_LIMIT can hold for typical exchanges.
+RECENT_CONVERSATION_ROW_LIMIT = 100
+
+_GREETING_PROMPT_TEMPLATE = Template(
+    """Generate a personalized initial greeting for the user. This is their first interaction in this new chat session.
+
+Create a warm, motivating greeting that acknowledges:
+1. The current time/day context
+2. Their existing commitment to their North Star
+3. Sets an energetic, focused tone for the session
+4. If recent conversations exist, mention what was discussed and highlight in exact words what the user said they wanted to do, if applicable
+5. Includes a brief check-in or prompt to get them engaged
+
+Keep it concise but inspiring.
+
+Current context:
+- Date: ${date}
+- Time: ${time}
+- Session type: ${session_type}
+- User has established North Star goal: ${north_star}
+- Recent conversations (last ${recent_hours}h):
+---
+
+${recent_activity}
+
+---
+"""
+)
+
+_INITIAL_PROFILE_TEMPLATE = Template(
+    """# USER PROFILE - The Catalyst Memory System
+
+## Overview & North Star
+- Primary Goal: ${description}
+- Success Metric: ${metric}
+- Timeline: ${timeline}
+- Start Date: ${start_date}
+- Initial Commitment Level: High
+
+## Key Patterns
+- [To be discovered through interaction]
+
+## Recurring Challenges
+- [To be identified through daily reflections]
+
+## Breakthroughs & Wins
+- Day 1: Set ambitious goal and committed to The Catalyst process
+
+## Personality Traits
+- Ambitious enough to seek AI mentorship
+- Action-oriented (chose to start today)
+
+## Current State & Momentum
+- Status: Ignition phase - full of potential energy
+- Next Focus: Establish daily ritual and build momentum
+- Energy: Fresh and ready to begin
+"""
+)
+
+
+def _recent_conversation_records(session: Session, cutoff: datetime) -> List[Row]:
+    """Newest-first conversation rows since ``cutoff`` as plain Core rows."""
+
+    conversation = models.Conversation
+    return list(
+        session.execute(
+            select(
+                conversation.id,
+                conversation.session_type,
+                conversation.conversation_uuid,
+                conversation.messages,
+                conversation.created_at,
+            )
+            .where(conversation.created_at >= cutoff)
+            .order_by(conversation.created_at.desc())
+            .limit(RECENT_CONVERSATION_ROW_LIMIT)
+        )
+    )
+
+
+def _greeting_already_saved(session: Session, conversation_id: str) -> bool:
+    """Whether the thread already holds its initial greeting row."""
+
+    return (
+        session.query(models.Conversation.id)
+        .filter(
+            models.Conversation.conversation_uuid == conversation_id,
+            models.Conversation.is_initial_greeting.is_(True),
+        )
+        .first()
+        is not None
+    )
+
+
+# A reload that changes none of the greeting's inputs reuses the last greeting
+# instead of paying for another model call.
+GREETING_CACHE_TTL_SECONDS = 600.0
+_greeting_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _greeting_cache_key(
+    session_value: str,
+    day: date,
+    goals: List[Dict[str, Any]],
+    ltm_profile: Dict[str, Any],
+    insights: List[Dict[str, Any]],
+    missed_info: Dict[str, Any],
+    recent_rows: List[Row],
+) -> str:
+    # Earlier greetings show up in recent_rows too; only user turns count, or
+    # every greeting would invalidate the next one.
+    payload = {
+        "session_type": session_value,
+        "day": day,
+        "goals": goals,
+        "ltm_profile": ltm_profile.get("_meta"),
+        "insights": [item.get("id") for item in insights],
+        "missed_sessions": missed_info.get("missed_sessions", []),
+        "user_turns": [row.id for row in recent_rows if row.user],
+    }
+    encoded = orjson.dumps(
+        payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _cached_greeting(key: str) -> Optional[Dict[str, Any]]:
+    cached = _greeting_cache.get(key)
+    if cached and monotonic() - cached[0] < GREETING_CACHE_TTL_SECONDS:
+        return cached[1]
+    return None
+
+
+def _store_greeting(key: str, response: Dict[str, Any]) -> None:
+    now = monotonic()
+    for stale_key in [
+        cached_key
+        for cached_key, (stored_at, _) in _greeting_cache.items()
+        if now - stored_at >= GREETING_CACHE_TTL_SECONDS
+    ]:
+        del _greeting_cache[stale_key]
+    _greeting_cache[key] = (now, response)
+
+
+_RITUAL_SESSION_TYPES = frozenset({SessionType.MORNING, SessionType.EVENING})
+
+
+def _resolve_session_type(
+    requested: SessionType, missed_info: Dict[str, Any]
+) -> SessionType:
+    """Swap a morning/evening request for catch-up when rituals were missed."""
+
+    if missed_info["needs_catchup"] and requested in _RITUAL_SESSION_TYPES:
+        return SessionType.CATCH_UP
+    return requested
+
+
+def _record_session_activity(
+    session: Session,
+    session_value: str,
+    text: str,
+    day: date,
+    track_session: bool,
+) -> None:
+    """Session tracking and ritual log writes that the chat reply never reads.
+
+    Both land in one transaction; the ritual log goes first so the refreshed
+    streak already counts it.
+    """
+
+    record_ritual_log(session, session_value, text, day=day)
+    if track_session:
+        record_session_tracking(session, session_value, utc_now())
+    session.commit()
+
+
+def _recent_greeting_rows(session: Session, cutoff: datetime) -> List[Row]:
+    """Newest-first window of user/catalyst text that fits the character budget.
+
+    SQLite extracts just the two text fields and keeps a running length total,
+    so the large debug payloads stored alongside them are never loaded.
+    """
+
+    conversation = models.Conversation
+    payload_valid = func.json_valid(conversation.messages)
+    user_text = case(
+        (payload_valid, func.json_extract(conversation.messages, "$.user"))
+    )
+    catalyst_text = case(
+        (payload_valid, func.json_extract(conversation.messages, "$.catalyst"))
+    )
+    entry_length = func.coalesce(func.length(user_text), 0) + func.coalesce(
+        func.length(catalyst_text), 0
+    )
+    windowed = (
+        select(
+            conversation.id,
+            conversation.conversation_uuid,
+            conversation.created_at,
+            user_text.label("user"),
+            catalyst_text.label("catalyst"),
+            entry_length.label("entry_length"),
+            func.sum(entry_length)
+            .over(order_by=(conversation.created_at.desc(), conversation.id.desc()))
+            .label("running_total"),
+        )
+        .where(conversation.created_at >= cutoff)
+        .subquery()
+    )
+    stmt = (
+        select(windowed)
+        .where(
+            windowed.c.running_total - windowed.c.entry_length
+            < RECENT_CONVERSATION_CHAR_LIMIT
+        )
+        .order_by(windowed.c.created_at.asc(), windowed.c.id.asc())
+    )
+    return list(session.execute(stmt))
+
 
 def _persisted_debug_fields(response: Dict[str, Any]) -> Dict[str, Any]:
     """Fields stored on conversation rows for the system-context debug UI."""
@@ -67,38 +298,17 @@ async def initialize_catalyst(
     )
     db.add(goal_row)
 
-    initial_profile = f"""# USER PROFILE - The Catalyst Memory System
-
-## Overview & North Star
-- Primary Goal: {goal.description}
-- Success Metric: {goal.metric or "Not specified"}
-- Timeline: {goal.timeline or "Not specified"}
-- Start Date: {local_today()}
-- Initial Commitment Level: High
-
-## Key Patterns
-- [To be discovered through interaction]
-
-## Recurring Challenges
-- [To be identified through daily reflections]
-
-## Breakthroughs & Wins
-- Day 1: Set ambitious goal and committed to The Catalyst process
-
-## Personality Traits
-- Ambitious enough to seek AI mentorship
-- Action-oriented (chose to start today)
-
-## Current State & Momentum
-- Status: Ignition phase - full of potential energy
-- Next Focus: Establish daily ritual and build momentum
-- Energy: Fresh and ready to begin
-"""
+    initial_profile = _INITIAL_PROFILE_TEMPLATE.substitute(
+        description=goal.description,
+        metric=goal.metric or "Not specified",
+        timeline=goal.timeline or "Not specified",
+        start_date=local_today(),
+    )
 
     profile_row = models.LTMProfile(
         summary_text=initial_profile,
         version=1,
-        token_count=len(initial_profile.split()),
+        token_count=estimate_tokens(initial_profile),
     )
     db.add(profile_row)
 
@@ -106,12 +316,10 @@ async def initialize_catalyst(
     db.add(tracking)
 
     db.commit()
-    db.refresh(goal_row)
-    db.refresh(profile_row)
 
     context = {
-        "goals": [serialize_goal_record(goal_row)],
-        "ltm_profile": get_ltm_profile_by_id(db, profile_row.id),
+        "goals": [serialize_goal_row(goal_row)],
+        "ltm_profile": serialize_ltm_profile(profile_row),
         "insights": get_recent_insights(db),
     }
 
@@ -143,19 +351,17 @@ async def initialize_catalyst(
     conversation_snapshot = models.Conversation(
         session_type=SessionType.INITIALIZATION.value,
         conversation_uuid=conversation_id,
-        messages=json.dumps(
-            {
-                "user": goal_prompt,
-                "catalyst": response["response"],
-                "timestamp": timestamp,
-                "function_calls": response.get("function_calls", []),
-                "model": response.get("model"),
-                "conversation_id": conversation_id,
-                "is_conversation_start": True,
-                "context_reference": context_reference,
-                **_persisted_debug_fields(response),
-            }
-        ),
+        messages={
+            "user": goal_prompt,
+            "catalyst": response["response"],
+            "timestamp": timestamp,
+            "function_calls": response.get("function_calls", []),
+            "model": response.get("model"),
+            "conversation_id": conversation_id,
+            "is_conversation_start": True,
+            "context_reference": context_reference,
+            **_persisted_debug_fields(response),
+        },
         thinking_log=response.get("thinking") or "",
     )
     db.add(conversation_snapshot)
@@ -183,26 +389,26 @@ async def get_initial_greeting(
     request: GreetingRequest, db: Session = Depends(get_db)
 ) -> ChatResponse:
     """Generate a personalized initial greeting for users with existing goals."""
-    missed_info = check_for_missed_sessions(db)
-    ltm_profile = get_current_ltm_profile(db)
-    goals = get_goals_hierarchy(db)
-    insights = get_recent_insights(db)
-
-    recent_cutoff = utc_now() - timedelta(hours=48)
-    recent_records = (
-        db.query(models.Conversation)
-        .filter(models.Conversation.created_at >= recent_cutoff)
-        .order_by(models.Conversation.created_at.desc())
-        .all()
+    (
+        missed_info,
+        ltm_profile,
+        goals,
+        insights,
+        recent_rows,
+    ) = await asyncio.gather(
+        run_in_session(check_for_missed_sessions),
+        run_in_session(get_current_ltm_profile),
+        run_in_session(get_goals_hierarchy),
+        run_in_session(get_recent_insights),
+        run_in_session(_recent_greeting_rows, utc_now() - RECENT_CONVERSATION_WINDOW),
     )
 
-    current_date = local_today()
     current_time = local_now()
+    current_date = current_time.date()
     conversation_entries: List[Dict[str, Any]] = []
     hours_window = 48
-    for record in reversed(recent_records):
-        messages = json.loads(record.messages) if record.messages else {}
-        created_local = to_local(record.created_at)
+    for row in recent_rows:
+        created_local = to_local(row.created_at)
         if created_local:
             days_ago = (current_date - created_local.date()).days
             if days_ago == 0:
@@ -223,12 +429,12 @@ async def get_initial_greeting(
             )
         else:
             timestamp = "Unknown time"
-        user_snippet = (messages.get("user", "") or "").strip()
-        catalyst_snippet = (messages.get("catalyst", "") or "").strip()
+        user_snippet = (row.user or "").strip()
+        catalyst_snippet = (row.catalyst or "").strip()
 
         entry = {
-            "id": record.id,
-            "conversation_id": conversation_id_for_record(record, messages),
+            "id": row.id,
+            "conversation_id": row.conversation_uuid,
             "timestamp": created_local.isoformat() if created_local else None,
             "user": user_snippet,
             "catalyst": catalyst_snippet,
@@ -246,49 +452,10 @@ async def get_initial_greeting(
                 "entry": entry,
                 "created": created_local,
                 "summary": summary_line,
-                "source": {"type": "record", "record_id": record.id},
+                "source": {"type": "record", "record_id": row.id},
             }
         )
 
-    def _conversation_character_count(items: List[Dict[str, Any]]) -> int:
-        return sum(
-            len((item["entry"].get("user") or ""))
-            + len((item["entry"].get("catalyst") or ""))
-            for item in items
-        )
-
-    total_chars = _conversation_character_count(conversation_entries)
-    if total_chars > RECENT_CONVERSATION_CHAR_LIMIT:
-        twenty_four_hours_ago = current_time - timedelta(hours=24)
-        filtered_entries = [
-            item
-            for item in conversation_entries
-            if item.get("created") and item["created"] >= twenty_four_hours_ago
-        ]
-        if filtered_entries:
-            conversation_entries = filtered_entries
-            total_chars = _conversation_character_count(conversation_entries)
-            hours_window = min(hours_window, 24)
-
-        if total_chars > RECENT_CONVERSATION_CHAR_LIMIT and conversation_entries:
-            trimmed_entries: List[Dict[str, Any]] = []
-            running_total = 0
-            for item in reversed(conversation_entries):
-                entry = item["entry"]
-                entry_length = len(entry.get("user") or "") + len(
-                    entry.get("catalyst") or ""
-                )
-                if (
-                    running_total + entry_length > RECENT_CONVERSATION_CHAR_LIMIT
-                    and trimmed_entries
-                ):
-                    continue
-                trimmed_entries.append(item)
-                running_total += entry_length
-                if running_total >= RECENT_CONVERSATION_CHAR_LIMIT:
-                    break
-            conversation_entries = list(reversed(trimmed_entries))
-
     recent_conversations = [item["entry"] for item in conversation_entries]
     recent_summary_lines = [
         item["summary"] for item in conversation_entries if item.get("summary")
@@ -316,15 +483,10 @@ async def get_initial_greeting(
             session_type=SessionType.GENERAL.value,
         )
 
-    session_type = request.session_type
-
-    if missed_info["needs_catchup"] and session_type in {
-        SessionType.MORNING,
-        SessionType.EVENING,
-    }:
-        session_type = SessionType.CATCH_UP
+    session_type = _resolve_session_type(request.session_type, missed_info)
+    session_value = session_type.value
 
-    print(f"{session_type=}")
+    logger.debug("initial greeting session_type=%s", session_value)
 
     context_sources = [item["source"] for item in conversation_entries]
 
@@ -350,57 +512,55 @@ async def get_initial_greeting(
         recent_activity_section = (
             f"- No conversations recorded in the last {recent_hours} hours."
         )
-    greeting_prompt = f"""Generate a personalized initial greeting for the user. This is their first interaction in this new chat session.
-
-Create a warm, motivating greeting that acknowledges:
-1. The current time/day context
-2. Their existing commitment to their North Star
-3. Sets an energetic, focused tone for the session
-4. If recent conversations exist, mention what was discussed and highlight in exact words what the user said they wanted to do, if applicable
-5. Includes a brief check-in or prompt to get them engaged
-
-Keep it concise but inspiring.
-
-Current context:
-- Date: {current_time.strftime("%A, %B %d, %Y")}
-- Time: {current_time.strftime("%I:%M %p")}
-- Session type: {session_type.value}
-- User has established North Star goal: {goals[0]["description"] if goals else "None"}
-- Recent conversations (last {recent_hours}h):
----
-
-{recent_activity_section}
-
----
-"""
+    greeting_prompt = _GREETING_PROMPT_TEMPLATE.substitute(
+        date=current_time.strftime("%A, %B %d, %Y"),
+        time=current_time.strftime("%I:%M %p"),
+        session_type=session_value,
+        north_star=goals[0]["description"] if goals else "None",
+        recent_hours=recent_hours,
+        recent_activity=recent_activity_section,
+    )
 
-    response = await generate_catalyst_response(
-        greeting_prompt,
-        session_type,
-        context,
-        output_mode="greeting",
+    cache_key = _greeting_cache_key(
+        session_value,
+        current_date,
+        goals,
+        ltm_profile,
+        insights,
+        missed_info,
+        recent_rows,
     )
+    response = _cached_greeting(cache_key)
+    cache_hit = response is not None
+    if response is None:
+        response = await generate_catalyst_response(
+            greeting_prompt,
+            session_type,
+            context,
+            output_mode="greeting",
+        )
+        _store_greeting(cache_key, response)
 
     conversation_id = str(uuid4())
     timestamp = utc_now().isoformat()
 
     greeting_record = models.Conversation(
-        session_type=session_type.value,
+        session_type=session_value,
         conversation_uuid=conversation_id,
-        messages=json.dumps(
-            {
-                "user": None,
-                "catalyst": response["response"],
-                "timestamp": timestamp,
-                "function_calls": response.get("function_calls", []),
-                "model": response.get("model"),
-                "initial_greeting": True,
-                "conversation_id": conversation_id,
-                "is_conversation_start": True,
-                "context_reference": context_reference,
-                **_persisted_debug_fields(response),
-            }
-        ),
+        messages={
+            "user": None,
+            "catalyst": response["response"],
+            "timestamp": timestamp,
+            "function_calls": response.get("function_calls", []),
+            "model": response.get("model"),
+            "initial_greeting": True,
+            "conversation_id": conversation_id,
+            "is_conversation_start": True,
+            "context_reference": context_reference,
+            "cache_hit": cache_hit,
+            **_persisted_debug_fields(response),
+        },
+        is_initial_greeting=True,
         thinking_log=response.get("thinking") or "",
     )
     db.add(greeting_record)
@@ -411,7 +571,7 @@ Current context:
     return ChatResponse(
         response=response["response"],
         memory_updated=False,
-        session_type=session_type.value,
+        session_type=session_value,
         conversation_id=conversation_id,
         message_id=message_id,
         thinking=response.get("thinking") if SHOW_THINKING else None,
@@ -420,17 +580,31 @@ Current context:
         context_snapshot=response.get("context_snapshot"),
         context_reference=context_reference,
         system_prompt_reference=response.get("system_prompt_reference"),
+        cache_hit=cache_hit,
     )
 
 
 @router.post("/chat", response_model=ChatResponse)
 async def chat_with_catalyst(
     message: ChatMessage,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ) -> ChatResponse:
-    missed_info = check_for_missed_sessions(db)
-    actual_session = message.session_type
-
+    (
+        missed_info,
+        ltm_profile,
+        goals,
+        insights,
+        recent_records,
+    ) = await asyncio.gather(
+        run_in_session(check_for_missed_sessions),
+        run_in_session(get_current_ltm_profile),
+        run_in_session(get_goals_hierarchy),
+        run_in_session(get_recent_insights),
+        run_in_session(
+            _recent_conversation_records, utc_now() - RECENT_CONVERSATION_WINDOW
+        ),
+    )
     conversation_id: Optional[str] = message.conversation_id
     if conversation_id is None and message.initial_greeting:
         conversation_id = message.initial_greeting.conversation_id
@@ -443,51 +617,45 @@ async def chat_with_catalyst(
             .first()
         )
         if latest_record and latest_record.messages:
-            try:
-                latest_payload = json.loads(latest_record.messages)
-            except json.JSONDecodeError:
-                latest_payload = {}
-            conversation_id = conversation_id_for_record(latest_record, latest_payload)
+            conversation_id = latest_record.conversation_uuid
         else:
             conversation_id = str(uuid4())
             created_new_conversation = True
 
-    if missed_info["needs_catchup"] and message.session_type in {
-        SessionType.MORNING,
-        SessionType.EVENING,
-    }:
-        actual_session = SessionType.CATCH_UP
+    actual_session = _resolve_session_type(message.session_type, missed_info)
+    session_value = actual_session.value
 
-    print(f"{actual_session=}")
-
-    ltm_profile = get_current_ltm_profile(db)
-    goals = get_goals_hierarchy(db)
+    logger.debug("chat session_type=%s", session_value)
 
     if not goals:
         return ChatResponse(
             response="I notice you haven't set your North Star goal yet. Let's start there - what extraordinary outcome do you want to achieve?",
             memory_updated=False,
-            session_type=actual_session.value,
+            session_type=session_value,
         )
 
-    insights = get_recent_insights(db)
+    current_time = local_now()
 
-    recent_cutoff = utc_now() - timedelta(hours=48)
-    recent_records = (
-        db.query(models.Conversation)
-        .filter(models.Conversation.created_at >= recent_cutoff)
-        .order_by(models.Conversation.created_at.desc())
-        .all()
-    )
+    def _entry_length(entry: Dict[str, Any]) -> int:
+        return len(entry.get("user") or "") + len(entry.get("catalyst") or "")
 
-    current_time = local_now()
+    def _make_conversation_item(
+        entry: Dict[str, Any], source: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            "entry": entry,
+            "source": source,
+            "created": parse_iso_timestamp(entry.get("timestamp")),
+        }
+
+    # Oldest first. Greetings only join once a user turn has been seen, or ahead
+    # of the next non-greeting record.
+    conversation_items: List[Dict[str, Any]] = []
+    pending_greeting_items: List[Dict[str, Any]] = []
+    user_message_seen = False
 
-    raw_entries: List[Dict[str, Any]] = []
     for record in reversed(recent_records):
-        try:
-            messages = json.loads(record.messages) if record.messages else {}
-        except json.JSONDecodeError:
-            messages = {}
+        messages = record.messages or {}
 
         user_text = messages.get("user") or ""
         catalyst_text = messages.get("catalyst") or ""
@@ -500,42 +668,15 @@ async def chat_with_catalyst(
             "session_type": record.session_type,
             "user": user_text,
             "catalyst": catalyst_text,
-            "conversation_id": conversation_id_for_record(record, messages),
+            "conversation_id": record.conversation_uuid,
             "timestamp": messages.get("timestamp")
             or (to_local(record.created_at).isoformat() if record.created_at else None),
         }
-
-        raw_entries.append(
-            {
-                "entry": entry,
-                "record_id": record.id,
-                "is_initial_greeting": is_initial_greeting,
-                "has_user_text": bool(user_text.strip()),
-            }
+        conversation_item = _make_conversation_item(
+            entry, {"type": "record", "record_id": record.id}
         )
 
-    def _entry_length(entry: Dict[str, Any]) -> int:
-        return len(entry.get("user") or "") + len(entry.get("catalyst") or "")
-
-    def _make_conversation_item(
-        entry: Dict[str, Any], source: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        return {
-            "entry": entry,
-            "source": source,
-            "created": parse_iso_timestamp(entry.get("timestamp")),
-        }
-
-    conversation_items: List[Dict[str, Any]] = []
-    pending_greeting_items: List[Dict[str, Any]] = []
-    user_message_seen = False
-
-    for item in raw_entries:
-        entry = item["entry"]
-        source = {"type": "record", "record_id": item["record_id"]}
-        conversation_item = _make_conversation_item(entry, source)
-
-        if item["is_initial_greeting"]:
+        if is_initial_greeting:
             if user_message_seen:
                 conversation_items.append(conversation_item)
             else:
@@ -546,7 +687,7 @@ async def chat_with_catalyst(
             conversation_items.extend(pending_greeting_items)
             pending_greeting_items = []
 
-        if item["has_user_text"]:
+        if user_text.strip():
             user_message_seen = True
 
         conversation_items.append(conversation_item)
@@ -597,20 +738,18 @@ async def chat_with_catalyst(
             )
 
         if total_chars > RECENT_CONVERSATION_CHAR_LIMIT and conversation_items:
-            trimmed_items: List[Dict[str, Any]] = []
+            # Keep the newest contiguous run that fits; the latest item always stays.
+            kept_items: Deque[Dict[str, Any]] = deque()
             running_total = 0
             for item in reversed(conversation_items):
                 entry_length = _entry_length(item["entry"])
-                if (
+                if kept_items and (
                     running_total + entry_length > RECENT_CONVERSATION_CHAR_LIMIT
-                    and trimmed_items
                 ):
-                    continue
-                trimmed_items.append(item)
-                running_total += entry_length
-                if running_total >= RECENT_CONVERSATION_CHAR_LIMIT:
                     break
-            conversation_items = list(reversed(trimmed_items))
+                kept_items.appendleft(item)
+                running_total += entry_length
+            conversation_items = list(kept_items)
 
     recent_conversations = [item["entry"] for item in conversation_items]
     context_sources = [item["source"] for item in conversation_items]
@@ -631,35 +770,32 @@ async def chat_with_catalyst(
         insights=insights,
     )
 
-    response = await generate_catalyst_response(
-        message.message, actual_session, context
+    persist_greeting = bool(
+        greeting_payload and greeting_payload.text and greeting_session_value
+    )
+    greeting_conversation_id = (
+        (greeting_payload.conversation_id or conversation_id)
+        if persist_greeting
+        else None
     )
+
+    # The greeting dedup lookup overlaps with the model call instead of
+    # adding a roundtrip after it.
+    if greeting_conversation_id:
+        response, greeting_already_saved = await asyncio.gather(
+            generate_catalyst_response(message.message, actual_session, context),
+            run_in_session(_greeting_already_saved, greeting_conversation_id),
+        )
+    else:
+        response = await generate_catalyst_response(
+            message.message, actual_session, context
+        )
+        greeting_already_saved = False
     memory_updated = response["memory_updated"]
 
-    if greeting_payload and greeting_payload.text and greeting_session_value:
-        greeting_conversation_id = greeting_payload.conversation_id or conversation_id
+    if persist_greeting:
         greeting_timestamp_value = greeting_timestamp or utc_now().isoformat()
 
-        greeting_already_saved = False
-        if greeting_conversation_id:
-            existing_greetings = (
-                db.query(models.Conversation)
-                .filter(
-                    models.Conversation.conversation_uuid == greeting_conversation_id
-                )
-                .all()
-            )
-            for existing in existing_greetings:
-                try:
-                    existing_payload = (
-                        json.loads(existing.messages) if existing.messages else {}
-                    )
-                except json.JSONDecodeError:
-                    existing_payload = {}
-                if existing_payload.get("initial_greeting"):
-                    greeting_already_saved = True
-                    break
-
         if not greeting_already_saved:
             greeting_reference = getattr(
                 greeting_payload, "context_reference", context_reference
@@ -667,28 +803,27 @@ async def chat_with_catalyst(
             greeting_record = models.Conversation(
                 session_type=greeting_session_value,
                 conversation_uuid=greeting_conversation_id,
-                messages=json.dumps(
-                    {
-                        "user": None,
-                        "catalyst": greeting_payload.text,
-                        "timestamp": greeting_timestamp_value,
-                        "function_calls": [],
-                        "model": greeting_payload.model,
-                        "initial_greeting": True,
-                        "conversation_id": greeting_conversation_id,
-                        "is_conversation_start": True,
-                        "context_reference": greeting_reference,
-                        "system_prompt": getattr(
-                            greeting_payload, "system_prompt", None
-                        ),
-                        "context_snapshot": getattr(
-                            greeting_payload, "context_snapshot", None
-                        ),
-                        "system_prompt_reference": getattr(
-                            greeting_payload, "system_prompt_reference", None
-                        ),
-                    }
-                ),
+                messages={
+                    "user": None,
+                    "catalyst": greeting_payload.text,
+                    "timestamp": greeting_timestamp_value,
+                    "function_calls": [],
+                    "model": greeting_payload.model,
+                    "initial_greeting": True,
+                    "conversation_id": greeting_conversation_id,
+                    "is_conversation_start": True,
+                    "context_reference": greeting_reference,
+                    "system_prompt": getattr(
+                        greeting_payload, "system_prompt", None
+                    ),
+                    "context_snapshot": getattr(
+                        greeting_payload, "context_snapshot", None
+                    ),
+                    "system_prompt_reference": getattr(
+                        greeting_payload, "system_prompt_reference", None
+                    ),
+                },
+                is_initial_greeting=True,
                 thinking_log="",
             )
             db.add(greeting_record)
@@ -698,60 +833,39 @@ async def chat_with_catalyst(
         created_new_conversation = False
 
     conversation = models.Conversation(
-        session_type=actual_session.value,
+        session_type=session_value,
         conversation_uuid=conversation_id,
-        messages=json.dumps(
-            {
-                "user": message.message,
-                "catalyst": response["response"],
-                "timestamp": utc_now().isoformat(),
-                "function_calls": response.get("function_calls", []),
-                "model": response.get("model"),
-                "conversation_id": conversation_id,
-                "is_conversation_start": created_new_conversation,
-                "context_reference": context_reference,
-                **_persisted_debug_fields(response),
-            }
-        ),
+        messages={
+            "user": message.message,
+            "catalyst": response["response"],
+            "timestamp": utc_now().isoformat(),
+            "function_calls": response.get("function_calls", []),
+            "model": response.get("model"),
+            "conversation_id": conversation_id,
+            "is_conversation_start": created_new_conversation,
+            "context_reference": context_reference,
+            **_persisted_debug_fields(response),
+        },
         thinking_log=response.get("thinking") or "",
     )
     db.add(conversation)
     db.flush()
     message_id = conversation.id
-
-    if actual_session in {SessionType.MORNING, SessionType.EVENING}:
-        update_session_tracking(actual_session.value)
-
-    if actual_session == SessionType.MORNING:
-        log = (
-            db.query(models.DailyLog)
-            .filter(models.DailyLog.date == local_today())
-            .one_or_none()
-        )
-        if not log:
-            log = models.DailyLog(date=local_today())
-            db.add(log)
-        log.morning_completed = True
-        log.morning_intention = message.message
-
-    if actual_session == SessionType.EVENING:
-        log = (
-            db.query(models.DailyLog)
-            .filter(models.DailyLog.date == local_today())
-            .one_or_none()
-        )
-        if not log:
-            log = models.DailyLog(date=local_today())
-            db.add(log)
-        log.evening_completed = True
-        log.evening_reflection = message.message
-
     db.commit()
 
+    background_tasks.add_task(
+        run_in_session,
+        _record_session_activity,
+        session_value,
+        message.message,
+        current_time.date(),
+        actual_session in _RITUAL_SESSION_TYPES,
+    )
+
     return ChatResponse(
         response=response["response"],
         memory_updated=memory_updated,
-        session_type=actual_session.value,
+        session_type=session_value,
         conversation_id=conversation_id,
         message_id=message_id,
         thinking=response.get("thinking") if SHOW_THINKING else None,
@@ -2,144 +2,158 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import hashlib
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Response
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import PlainTextResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session, aliased
 
 from .. import models
 from ..catalyst_ai import reconstruct_system_prompt
 from ..conversation import (
     build_conversation_filename,
-    conversation_id_for_record,
     generate_markdown_export,
     load_conversation_transcript,
-    message_timestamp,
-    parse_iso_timestamp,
     reconstruct_context_from_reference,
 )
-from ..dependencies import get_db
+from ..dependencies import get_db, get_read_db
+from ..memory_manager import cached_context
 from ..schemas import SessionType
 from ..time_utils import to_local
 
 router = APIRouter()
 
+PREVIEW_CHAR_LIMIT = 160
+_BLANK = " \t\r\n"
+
 
 @router.get("/conversations/recent")
 async def get_recent_conversations(
-    limit: int = 5, db: Session = Depends(get_db)
+    limit: int = 5, db: Session = Depends(get_read_db)
 ) -> List[Dict[str, Any]]:
-    records = (
-        db.query(models.Conversation)
-        .order_by(models.Conversation.created_at.desc())
-        .limit(limit)
-        .all()
+    return cached_context(
+        "recent_conversations",
+        lambda: _recent_conversation_summaries(db, limit),
+        variant=limit,
     )
 
-    conversations: List[Dict[str, Any]] = []
-    for record in records:
-        messages = json.loads(record.messages) if record.messages else {}
-        conversations.append(
-            {
-                "id": record.id,
-                "session_type": record.session_type,
-                "timestamp": (
-                    to_local(record.created_at).isoformat()
-                    if record.created_at
-                    else None
-                ),
-                "user_message": messages.get("user", ""),
-                "catalyst_response": (messages.get("catalyst", "")[:200] + "...")
-                if messages.get("catalyst")
-                else "",
-                "function_calls": len(messages.get("function_calls", [])),
-            }
+
+def _recent_conversation_summaries(db: Session, limit: int) -> List[Dict[str, Any]]:
+    conversation = models.Conversation
+    payload_valid = func.json_valid(conversation.messages)
+    rows = db.execute(
+        select(
+            conversation.id,
+            conversation.session_type,
+            conversation.created_at,
+            case((payload_valid, func.json_extract(conversation.messages, "$.user")))
+            .label("user"),
+            case(
+                (
+                    payload_valid,
+                    func.substr(
+                        func.json_extract(conversation.messages, "$.catalyst"), 1, 200
+                    ),
+                )
+            ).label("catalyst"),
+            case(
+                (
+                    payload_valid,
+                    func.json_array_length(conversation.messages, "$.function_calls"),
+                )
+            ).label("function_calls"),
         )
-    return conversations
+        .order_by(conversation.created_at.desc())
+        .limit(limit)
+    )
+
+    return [
+        {
+            "id": row.id,
+            "session_type": row.session_type,
+            "timestamp": (
+                to_local(row.created_at).isoformat() if row.created_at else None
+            ),
+            "user_message": row.user or "",
+            "catalyst_response": f"{row.catalyst}..." if row.catalyst else "",
+            "function_calls": row.function_calls or 0,
+        }
+        for row in rows
+    ]
 
 
 @router.get("/conversations")
 async def list_conversations(
-    limit: Optional[int] = None, db: Session = Depends(get_db)
+    limit: Optional[int] = None, db: Session = Depends(get_read_db)
 ) -> Dict[str, Any]:
-    query = db.query(models.Conversation).order_by(
-        models.Conversation.created_at.desc()
+    conversation = models.Conversation
+    summary_query = (
+        select(
+            conversation.conversation_uuid,
+            func.count().label("message_count"),
+            func.min(conversation.created_at).label("started_at"),
+            func.max(conversation.created_at).label("updated_at"),
+            func.group_concat(conversation.session_type.distinct()).label(
+                "session_types"
+            ),
+        )
+        .group_by(conversation.conversation_uuid)
+        .order_by(func.max(conversation.created_at).desc())
     )
     if limit:
-        query = query.limit(limit)
-
-    records = query.all()
-    grouped: Dict[str, Dict[str, Any]] = {}
-
-    for record in records:
-        try:
-            messages = json.loads(record.messages) if record.messages else {}
-        except json.JSONDecodeError:
-            messages = {}
-
-        conversation_id = conversation_id_for_record(record, messages)
-        timestamp_iso = message_timestamp(messages, record)
-        timestamp_dt = parse_iso_timestamp(timestamp_iso) or to_local(
-            record.created_at
+        summary_query = summary_query.limit(limit)
+    summary = summary_query.subquery()
+
+    # Preview: newest turn in the thread with user (else catalyst) text.
+    preview_row = aliased(conversation)
+    preview_text = func.trim(
+        func.coalesce(
+            func.nullif(
+                func.trim(func.json_extract(preview_row.messages, "$.user"), _BLANK),
+                "",
+            ),
+            func.json_extract(preview_row.messages, "$.catalyst"),
+        ),
+        _BLANK,
+    )
+    preview = (
+        select(func.substr(preview_text, 1, PREVIEW_CHAR_LIMIT))
+        .where(
+            preview_row.conversation_uuid == summary.c.conversation_uuid,
+            func.json_valid(preview_row.messages),
+            preview_text != "",
         )
+        .order_by(preview_row.created_at.desc(), preview_row.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
 
-        info = grouped.setdefault(
-            conversation_id,
-            {
-                "conversation_id": conversation_id,
-                "message_count": 0,
-                "preview": "",
-                "started_at": timestamp_dt,
-                "updated_at": timestamp_dt,
-                "session_types": set(),
-            },
+    rows = db.execute(
+        select(summary, preview.label("preview")).order_by(
+            summary.c.updated_at.desc()
         )
-
-        info["message_count"] += 1
-        if timestamp_dt and (
-            info["started_at"] is None or timestamp_dt < info["started_at"]
-        ):
-            info["started_at"] = timestamp_dt
-        if timestamp_dt and (
-            info["updated_at"] is None or timestamp_dt > info["updated_at"]
-        ):
-            info["updated_at"] = timestamp_dt
-
-        if record.session_type:
-            info["session_types"].add(record.session_type)
-
-        preview_source = (
-            messages.get("user") or messages.get("catalyst") or ""
-        ).strip()
-        if preview_source and not info["preview"]:
-            info["preview"] = preview_source[:160]
+    )
 
     conversations_list: List[Dict[str, Any]] = []
-    for data in grouped.values():
-        session_types = sorted(data["session_types"])
+    for row in rows:
+        started_at = to_local(row.started_at)
+        updated_at = to_local(row.updated_at)
         conversations_list.append(
             {
-                "conversation_id": data["conversation_id"],
-                "message_count": data["message_count"],
-                "preview": data["preview"],
-                "started_at": data["started_at"].isoformat()
-                if isinstance(data["started_at"], datetime)
-                else data["started_at"],
-                "updated_at": data["updated_at"].isoformat()
-                if isinstance(data["updated_at"], datetime)
-                else data["updated_at"],
-                "session_types": session_types,
+                "conversation_id": row.conversation_uuid,
+                "message_count": row.message_count,
+                "preview": row.preview or "",
+                "started_at": started_at.isoformat() if started_at else None,
+                "updated_at": updated_at.isoformat() if updated_at else None,
+                "session_types": sorted(
+                    row.session_types.split(",") if row.session_types else []
+                ),
             }
         )
 
-    conversations_list.sort(
-        key=lambda item: item["updated_at"] or "",
-        reverse=True,
-    )
-
     latest_conversation_id = (
         conversations_list[0]["conversation_id"] if conversations_list else None
     )
@@ -154,38 +168,12 @@ async def list_conversations(
 async def delete_conversation(
     conversation_id: str, db: Session = Depends(get_db)
 ) -> Response:
-    deleted_count = 0
-
-    matching_records = (
+    deleted_count = (
         db.query(models.Conversation)
         .filter(models.Conversation.conversation_uuid == conversation_id)
-        .all()
+        .delete(synchronize_session=False)
     )
 
-    for record in matching_records:
-        db.delete(record)
-        deleted_count += 1
-
-    if deleted_count == 0:
-        legacy_records = (
-            db.query(models.Conversation)
-            .filter(models.Conversation.conversation_uuid.is_(None))
-            .all()
-        )
-
-        for record in legacy_records:
-            if not record.messages:
-                continue
-            try:
-                payload = json.loads(record.messages)
-            except json.JSONDecodeError:
-                payload = {}
-
-            derived_id = conversation_id_for_record(record, payload)
-            if derived_id == conversation_id:
-                db.delete(record)
-                deleted_count += 1
-
     if deleted_count == 0:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
@@ -216,34 +204,62 @@ async def export_conversation_markdown(
     return PlainTextResponse(markdown, media_type="text/markdown", headers=headers)
 
 
+def _decode_payload_object(value: Optional[str]) -> Any:
+    """Decode a JSON object/array extracted by ``json_extract`` (None if absent)."""
+
+    if value is None:
+        return None
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
 @router.get("/conversations/{conversation_id}/messages/{message_id}/context")
 async def get_message_context(
     conversation_id: str,
     message_id: int,
+    request: Request,
     db: Session = Depends(get_db),
-) -> Dict[str, Any]:
-    record = (
-        db.query(models.Conversation)
-        .filter(models.Conversation.id == message_id)
-        .one_or_none()
-    )
+) -> Response:
+    # Pull only the four context fields out of the payload in SQLite; the
+    # message text and function calls are never decoded here.
+    conversation = models.Conversation
+    payload_valid = func.json_valid(conversation.messages)
+
+    def _payload_field(key: str) -> Any:
+        return case(
+            (payload_valid, func.json_extract(conversation.messages, f"$.{key}"))
+        ).label(key)
+
+    record = db.execute(
+        select(
+            conversation.session_type,
+            conversation.conversation_uuid,
+            _payload_field("context_reference"),
+            _payload_field("context_snapshot"),
+            _payload_field("system_prompt"),
+            _payload_field("system_prompt_reference"),
+        ).where(conversation.id == message_id)
+    ).one_or_none()
 
     if record is None:
         raise HTTPException(status_code=404, detail="Message not found")
 
-    try:
-        payload = json.loads(record.messages) if record.messages else {}
-    except json.JSONDecodeError:
-        payload = {}
-
-    record_conversation_id = conversation_id_for_record(record, payload)
-    if record_conversation_id != conversation_id:
+    if record.conversation_uuid != conversation_id:
         raise HTTPException(status_code=404, detail="Message not part of conversation")
 
-    reference = payload.get("context_reference")
-    snapshot = payload.get("context_snapshot")
-    system_prompt = payload.get("system_prompt")
-    system_prompt_reference = payload.get("system_prompt_reference")
+    reference = _decode_payload_object(record.context_reference)
+    snapshot = _decode_payload_object(record.context_snapshot)
+    system_prompt = record.system_prompt
+    system_prompt_reference = _decode_payload_object(record.system_prompt_reference)
 
     if reference:
         context_payload = reconstruct_context_from_reference(db, reference)
@@ -302,7 +318,7 @@ async def get_message_context(
                 stored_base["checksum"] == runtime_base_metadata["checksum"]
             )
 
-    return {
+    payload = {
         "conversation_id": conversation_id,
         "message_id": message_id,
         "context": context_payload,
@@ -313,3 +329,12 @@ async def get_message_context(
         "system_prompt_runtime_base": runtime_base_metadata,
         "system_prompt_checksum_match": checksum_match,
     }
+
+    # Encode once and tag the bytes, so re-opening the same message costs
+    # a 304 with no body on the wire.
+    body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
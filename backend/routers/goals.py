@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from .. import models
-from ..dependencies import get_db
+from ..dependencies import get_db, get_read_db
 from ..memory_manager import (
     get_goals_hierarchy,
     serialize_goal_row,
@@ -40,7 +40,7 @@ def _apply_north_star_promotion(
 
 
 @router.get("/goals")
-async def get_goals(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_goals(db: Session = Depends(get_read_db)) -> Dict[str, Any]:
     goals = get_goals_hierarchy(db)
     return {
         "goals": goals,
@@ -78,7 +78,6 @@ async def create_goal(
     )
     db.add(goal)
     db.commit()
-    db.refresh(goal)
     return {"status": "success", "goal": serialize_goal_row(goal)}
 
 
@@ -123,5 +122,4 @@ async def update_goal(
         sync_ltm_north_star(db, goal.description, goal.metric, goal.timeline)
 
     db.commit()
-    db.refresh(goal)
     return {"status": "success", "goal": serialize_goal_row(goal)}
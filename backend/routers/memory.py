@@ -2,124 +2,130 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import Any, Dict, List
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import func
+from sqlalchemy import case, func, select, update
 from sqlalchemy.orm import Session
 
 from .. import models
-from ..dependencies import get_db
-from ..memory_manager import compute_streak, get_current_ltm_profile
+from ..dependencies import get_db, get_read_db
+from ..memory_manager import cached_context, compute_streak, get_current_ltm_profile
+from ..schemas import DailyLogEntry, InsightEntry
 from ..time_utils import local_today
 
 router = APIRouter()
 
 
 @router.get("/memory/profile")
-async def get_memory_profile(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_memory_profile(db: Session = Depends(get_read_db)) -> Dict[str, Any]:
     return get_current_ltm_profile(db)
 
 
-@router.get("/logs/recent")
+# Cached entries are validated models, never ORM rows: the rows belong to the
+# request's session and would be shared detached across later requests.
+@router.get("/logs/recent", response_model=List[DailyLogEntry])
 async def get_recent_logs(
-    days: int = 7, db: Session = Depends(get_db)
-) -> List[Dict[str, Any]]:
+    days: int = 7, db: Session = Depends(get_read_db)
+) -> List[DailyLogEntry]:
     cutoff = local_today() - timedelta(days=days)
-    logs = (
-        db.query(models.DailyLog)
-        .filter(models.DailyLog.date >= cutoff)
-        .order_by(models.DailyLog.date.desc())
-        .all()
+    return cached_context(
+        "recent_logs",
+        lambda: [
+            DailyLogEntry.model_validate(row)
+            for row in db.query(models.DailyLog)
+            .filter(models.DailyLog.date >= cutoff)
+            .order_by(models.DailyLog.date.desc())
+        ],
+        variant=cutoff,
     )
 
-    return [
-        {
-            "id": log.id,
-            "date": log.date.isoformat() if log.date else None,
-            "morning_completed": log.morning_completed,
-            "evening_completed": log.evening_completed,
-            "morning_intention": log.morning_intention,
-            "evening_reflection": log.evening_reflection,
-            "wins": log.wins,
-            "challenges": log.challenges,
-            "gratitude": log.gratitude,
-            "next_day_priorities": log.next_day_priorities,
-            "energy_level": log.energy_level,
-            "focus_rating": log.focus_rating,
-        }
-        for log in logs
-    ]
-
-
-@router.get("/insights")
+
+@router.get("/insights", response_model=List[InsightEntry])
 async def get_insights(
-    limit: int = 10, db: Session = Depends(get_db)
-) -> List[Dict[str, Any]]:
-    insights = (
-        db.query(models.Insight)
-        .order_by(
-            models.Insight.importance_score.desc(),
-            models.Insight.date_identified.desc(),
-        )
-        .limit(limit)
-        .all()
+    limit: int = 10, db: Session = Depends(get_read_db)
+) -> List[InsightEntry]:
+    return cached_context(
+        "insight_list",
+        lambda: [
+            InsightEntry.model_validate(row)
+            for row in db.query(models.Insight)
+            .order_by(
+                models.Insight.importance_score.desc(),
+                models.Insight.date_identified.desc(),
+            )
+            .limit(limit)
+        ],
+        variant=limit,
     )
-    return [
-        {
-            "id": insight.id,
-            "insight_type": insight.insight_type,
-            "category": insight.category,
-            "description": insight.description,
-            "importance_score": insight.importance_score,
-            "date_identified": insight.date_identified.isoformat()
-            if insight.date_identified
-            else None,
-        }
-        for insight in insights
-    ]
 
 
 @router.get("/stats")
 async def get_user_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
-    tracking = (
-        db.query(models.SessionTracking)
-        .order_by(models.SessionTracking.id.desc())
-        .first()
+    today = local_today()
+    stats, stale_tracking_id = cached_context(
+        "stats", lambda: _load_user_stats(db, today), variant=today
     )
+    if stale_tracking_id is not None:
+        # Persist the recomputed streak; the commit also drops the cached stats.
+        db.execute(
+            update(models.SessionTracking)
+            .where(models.SessionTracking.id == stale_tracking_id)
+            .values(streak_count=stats["streak"])
+        )
+        db.commit()
+    return stats
 
-    thirty_days_ago = local_today() - timedelta(days=30)
 
-    stats = (
-        db.query(
-            func.count(models.DailyLog.id).label("total_days"),
-            func.sum(func.coalesce(models.DailyLog.morning_completed, 0)).label(
-                "mornings_completed"
+def _load_user_stats(
+    db: Session, today: date
+) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Read the stats payload plus the tracking row id if its streak is stale."""
+
+    thirty_days_ago = today - timedelta(days=30)
+
+    def _latest_tracking(column: Any) -> Any:
+        return (
+            select(column)
+            .order_by(models.SessionTracking.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    def _count_true(column: Any) -> Any:
+        return func.sum(case((column.is_(True), 1), else_=0))
+
+    stats = db.execute(
+        select(
+            _latest_tracking(models.SessionTracking.id).label("tracking_id"),
+            _latest_tracking(models.SessionTracking.streak_count).label(
+                "stored_streak"
             ),
-            func.sum(func.coalesce(models.DailyLog.evening_completed, 0)).label(
-                "evenings_completed"
+            _latest_tracking(models.SessionTracking.total_sessions).label(
+                "total_sessions"
             ),
+            func.count(models.DailyLog.id).label("total_days"),
+            _count_true(models.DailyLog.morning_completed).label("mornings_completed"),
+            _count_true(models.DailyLog.evening_completed).label("evenings_completed"),
             func.avg(models.DailyLog.energy_level).label("avg_energy"),
             func.avg(models.DailyLog.focus_rating).label("avg_focus"),
-        )
-        .filter(models.DailyLog.date >= thirty_days_ago)
-        .one()
-    )
+        ).where(models.DailyLog.date >= thirty_days_ago)
+    ).one()
 
     total_days = stats.total_days or 0
     divisor = total_days if total_days else 1
 
     streak = compute_streak(db)
-    if tracking:
-        tracking.streak_count = streak
-        db.commit()
+    stale_tracking_id = (
+        stats.tracking_id
+        if stats.tracking_id is not None and stats.stored_streak != streak
+        else None
+    )
 
-    return {
+    payload = {
         "streak": streak,
-        "total_sessions": tracking.total_sessions
-        if tracking and tracking.total_sessions is not None
-        else 0,
+        "total_sessions": stats.total_sessions or 0,
         "completion_rate": {
             "morning": (stats.mornings_completed or 0) / divisor * 100,
             "evening": (stats.evenings_completed or 0) / divisor * 100,
@@ -127,3 +133,4 @@ async def get_user_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
         "average_energy": float(stats.avg_energy or 0),
         "average_focus": float(stats.avg_focus or 0),
     }
+    return payload, stale_tracking_id
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from .. import models
@@ -14,13 +14,30 @@ from ..catalyst_ai import (
     get_session_instructions,
 )
 from ..config import MODEL_NAME
-from ..dependencies import get_db
+from ..dependencies import get_read_db
 from ..llm_client import is_configured
 from ..rate_limiter import estimate_tokens, rate_limiter
 from ..schemas import SessionType
 
 router = APIRouter()
 
+# Browsers request /favicon.ico on every navigation; answer with a pre-built
+# empty 204 response instead of a 404.
+_FAVICON_RESPONSE = Response(status_code=204)
+
+# /test/functions sends the same probe every time; build it once.
+_TEST_MESSAGE = (
+    'Respond with JSON: {"reply": "Test ok", "daily_log": null, '
+    '"memory_update": null, "insights": null}'
+)
+_TEST_MESSAGES = (
+    {
+        "role": "system",
+        "content": "You are a test assistant. Respond with valid JSON only.",
+    },
+    {"role": "user", "content": _TEST_MESSAGE},
+)
+
 
 @router.get("/")
 async def root() -> Dict[str, Any]:
@@ -32,8 +49,13 @@ async def root() -> Dict[str, Any]:
     }
 
 
+@router.get("/favicon.ico", include_in_schema=False)
+async def favicon() -> Response:
+    return _FAVICON_RESPONSE
+
+
 @router.get("/health")
-async def health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def health_check(db: Session = Depends(get_read_db)) -> Dict[str, Any]:
     try:
         goal_count = db.query(models.Goal).count()
         memory_count = db.query(models.LTMProfile).count()
@@ -58,31 +80,20 @@ async def test_function_calling() -> Dict[str, Any]:
     if not is_configured():
         raise HTTPException(status_code=500, detail="CLOD API key not configured")
 
+    # Estimated per call: the chars-per-token ratio is recalibrated over time.
+    estimated_tokens = estimate_tokens(_TEST_MESSAGE)
     try:
-        test_message = (
-            'Respond with JSON: {"reply": "Test ok", "daily_log": null, '
-            '"memory_update": null, "insights": null}'
-        )
-        messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are a test assistant. Respond with valid JSON only."
-                ),
-            },
-            {"role": "user", "content": test_message},
-        ]
-
-        estimated = estimate_tokens(test_message)
         response, model_used = await _make_api_call_with_retry(
             MODEL_NAME,
-            messages,
+            list(_TEST_MESSAGES),
             temperature=0.3,
-            estimated_prompt_tokens=estimated,
+            estimated_prompt_tokens=estimated_tokens,
             context="test",
         )
         response_text = _extract_response_text(response)
-        await rate_limiter.record_usage(model_used, estimate_tokens(response_text))
+        await rate_limiter.record_usage(
+            model_used, estimated_tokens + estimate_tokens(response_text)
+        )
 
         return {
             "status": "success",
@@ -110,10 +121,12 @@ async def get_rate_limit_status() -> Dict[str, Any]:
     import time
 
     status = {}
+    usage_by_model = await rate_limiter.snapshot()
     current_time = time.monotonic()
 
     for model_name, limits in rate_limiter._limits.items():
-        if model_name not in rate_limiter._states:
+        usage = usage_by_model.get(model_name)
+        if usage is None:
             status[model_name] = {
                 "requests_remaining": limits.get("rpm", 0),
                 "tokens_remaining": limits.get("tpm", 0),
@@ -123,51 +136,27 @@ async def get_rate_limit_status() -> Dict[str, Any]:
             }
             continue
 
-        state = rate_limiter._states[model_name]
-
-        requests_used_this_minute = len(
-            [t for t in state.minute_requests if current_time - t < 60.0]
-        )
-
-        tokens_used_this_minute = sum(
-            [
-                count
-                for timestamp, count in state.token_events
-                if current_time - timestamp < 60.0
-            ]
-        )
-
-        requests_used_today = len(
-            [t for t in state.day_requests if current_time - t < 86400.0]
-        )
-
         rpm_limit = limits.get("rpm", 0)
         tpm_limit = limits.get("tpm", 0)
         rpd_limit = limits.get("rpd", 0)
 
         requests_remaining = (
-            max(0, rpm_limit - requests_used_this_minute) if rpm_limit else float("inf")
+            max(0, rpm_limit - usage.minute_requests) if rpm_limit else float("inf")
         )
         tokens_remaining = (
-            max(0, tpm_limit - tokens_used_this_minute) if tpm_limit else float("inf")
+            max(0, tpm_limit - usage.minute_tokens) if tpm_limit else float("inf")
         )
         daily_remaining = (
-            max(0, rpd_limit - requests_used_today) if rpd_limit else float("inf")
+            max(0, rpd_limit - usage.day_requests) if rpd_limit else float("inf")
         )
 
         estimated_wait = 0
-        if requests_remaining == 0 and state.minute_requests:
-            estimated_wait = max(
-                estimated_wait, 60.0 - (current_time - state.minute_requests[0])
-            )
-        if tokens_remaining == 0 and state.token_events:
-            estimated_wait = max(
-                estimated_wait, 60.0 - (current_time - state.token_events[0][0])
-            )
-        if daily_remaining == 0 and state.day_requests:
-            estimated_wait = max(
-                estimated_wait, 86400.0 - (current_time - state.day_requests[0])
-            )
+        if requests_remaining == 0:
+            estimated_wait = max(estimated_wait, usage.minute_requests_reset_in)
+        if tokens_remaining == 0:
+            estimated_wait = max(estimated_wait, usage.minute_tokens_reset_in)
+        if daily_remaining == 0:
+            estimated_wait = max(estimated_wait, usage.day_requests_reset_in)
 
         if estimated_wait > 0:
             quota_status = "rate_limited"
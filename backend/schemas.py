@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SessionType(str, Enum):
@@ -81,6 +82,7 @@ class ChatResponse(BaseModel):
     context_snapshot: Optional[Dict[str, Any]] = None
     context_reference: Optional[Dict[str, Any]] = None
     system_prompt_reference: Optional[Dict[str, Any]] = None
+    cache_hit: bool = False
 
 
 class GreetingRequest(BaseModel):
@@ -111,3 +113,31 @@ class GoalUpdate(BaseModel):
     timeline: Optional[str] = None
     rank: Optional[int] = None
     is_active: Optional[bool] = None
+
+
+class DailyLogEntry(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    date: Optional[datetime.date] = None
+    morning_completed: Optional[bool] = None
+    evening_completed: Optional[bool] = None
+    morning_intention: Optional[str] = None
+    evening_reflection: Optional[str] = None
+    wins: Optional[str] = None
+    challenges: Optional[str] = None
+    gratitude: Optional[str] = None
+    next_day_priorities: Optional[str] = None
+    energy_level: Optional[int] = None
+    focus_rating: Optional[int] = None
+
+
+class InsightEntry(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    insight_type: Optional[str] = None
+    category: Optional[str] = None
+    description: str
+    importance_score: Optional[int] = None
+    date_identified: Optional[datetime.date] = None
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timezone, tzinfo
 from typing import Optional
+from zoneinfo import ZoneInfo
+
+from .config import LOCAL_TIMEZONE
+
+# Resolved once at import; None defers to the system zone on each conversion.
+LOCAL_TZ: Optional[tzinfo] = ZoneInfo(LOCAL_TIMEZONE) if LOCAL_TIMEZONE else None
 
 
 def utc_now() -> datetime:
@@ -15,7 +21,7 @@ def utc_now() -> datetime:
 def local_now() -> datetime:
     """Return the current local time as an aware datetime."""
 
-    return utc_now().astimezone()
+    return utc_now().astimezone(LOCAL_TZ)
 
 
 def local_today() -> date:
@@ -37,4 +43,23 @@ def to_local(dt: Optional[datetime]) -> Optional[datetime]:
 
     if dt is None:
         return None
-    return ensure_utc(dt).astimezone()
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(LOCAL_TZ)
+
+
+def parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 string (``Z`` suffix allowed) into an aware datetime.
+
+    Naive values are assumed to be UTC; unparseable input returns None.
+    """
+
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
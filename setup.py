@@ -104,7 +104,7 @@ def main():
     if deps_ok and env_ok:
         print("🎉 Setup complete! You can now run:")
         print("   uvicorn backend.app:app --reload")
-        print("\nThen open frontend/index.html in your browser")
+        print("\nThen open http://localhost:8000/frontend/ in your browser")
     else:
         print("⚠️  Setup incomplete. Please address the issues above.")
         if not deps_ok:
@@ -1,13 +1,14 @@
-import json
 import os
 import uuid
 from contextlib import contextmanager
+from datetime import timedelta
 
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 
 from fastapi.testclient import (
     TestClient,  # noqa: E402  pylint: disable=wrong-import-position
 )
+from sqlalchemy import text  # noqa: E402  pylint: disable=wrong-import-position
 
 from backend import models  # noqa: E402  pylint: disable=wrong-import-position
 from backend.app import app  # noqa: E402  pylint: disable=wrong-import-position
@@ -15,6 +16,10 @@ from backend.database import (  # noqa: E402  pylint: disable=wrong-import-posit
     SessionLocal,
     init_database,
 )
+from backend.routers.chat import (  # noqa: E402  pylint: disable=wrong-import-position
+    _recent_greeting_rows,
+)
+from backend.time_utils import utc_now  # noqa: E402  pylint: disable=wrong-import-position
 
 init_database()
 
@@ -42,7 +47,7 @@ def _create_conversation(conversation_id: str | None = None) -> str:
         record = models.Conversation(
             conversation_uuid=conversation_uuid,
             session_type="general",
-            messages=json.dumps(payload),
+            messages=payload,
         )
         session.add(record)
         session.commit()
@@ -109,6 +114,196 @@ def test_delete_conversation_removes_history_entries():
         assert second_delete.json().get("detail") == "Conversation not found"
 
 
+def test_malformed_stored_payload_does_not_break_listing():
+    _clear_conversations()
+    conversation_id = _create_conversation()
+
+    session = SessionLocal()
+    try:
+        session.execute(
+            text(
+                "INSERT INTO conversations (conversation_uuid, session_type, messages) "
+                "VALUES (:uuid, 'general', '{not json')"
+            ),
+            {"uuid": conversation_id},
+        )
+        session.commit()
+        stored = (
+            session.query(models.Conversation)
+            .filter(models.Conversation.conversation_uuid == conversation_id)
+            .all()
+        )
+        assert {"_invalid_json": "{not json"} in [row.messages for row in stored]
+    finally:
+        session.close()
+
+    with client_context() as client:
+        response = client.get("/conversations")
+
+    assert response.status_code == 200
+    conversations = response.json()["conversations"]
+    assert conversations[0]["conversation_id"] == conversation_id
+    assert conversations[0]["message_count"] == 2
+
+
+def test_conversations_listing_aggregates_threads_in_sql():
+    _clear_conversations()
+    older_id, newer_id = str(uuid.uuid4()), str(uuid.uuid4())
+    base = utc_now() - timedelta(hours=3)
+    session = SessionLocal()
+    try:
+        for offset, thread, session_type, payload in (
+            (0, older_id, "morning", {"user": "Old question", "catalyst": "Old"}),
+            (1, newer_id, "general", {"user": None, "catalyst": "Greeting"}),
+            (2, newer_id, "evening", {"user": "x" * 300, "catalyst": "Reply"}),
+            (3, newer_id, "general", {"user": "   ", "catalyst": "Latest reply"}),
+        ):
+            session.add(
+                models.Conversation(
+                    conversation_uuid=thread,
+                    session_type=session_type,
+                    messages=payload,
+                    created_at=base + timedelta(minutes=offset),
+                )
+            )
+        session.commit()
+    finally:
+        session.close()
+
+    with client_context() as client:
+        data = client.get("/conversations").json()
+        limited = client.get("/conversations", params={"limit": 1}).json()
+
+    first, second = data["conversations"]
+    assert data["latest_conversation_id"] == newer_id
+    assert first["conversation_id"] == newer_id
+    assert first["message_count"] == 3
+    assert first["session_types"] == ["evening", "general"]
+    assert first["preview"] == "Latest reply"
+    assert first["started_at"] < first["updated_at"]
+    assert second["preview"] == "Old question"
+    assert [item["conversation_id"] for item in limited["conversations"]] == [newer_id]
+
+
+def test_message_context_reads_stored_context_fields():
+    _clear_conversations()
+    conversation_id = str(uuid.uuid4())
+    snapshot = {"goals": [{"id": 1, "description": "Ship it"}], "insights": []}
+    session = SessionLocal()
+    try:
+        record = models.Conversation(
+            conversation_uuid=conversation_id,
+            session_type="general",
+            messages={
+                "user": "Hi",
+                "catalyst": "Hello",
+                "system_prompt": "You are The Catalyst.",
+                "context_snapshot": snapshot,
+            },
+        )
+        session.add(record)
+        session.commit()
+        message_id = record.id
+    finally:
+        session.close()
+
+    with client_context() as client:
+        response = client.get(
+            f"/conversations/{conversation_id}/messages/{message_id}/context"
+        )
+        wrong_thread = client.get(
+            f"/conversations/{uuid.uuid4()}/messages/{message_id}/context"
+        )
+        not_modified = client.get(
+            f"/conversations/{conversation_id}/messages/{message_id}/context",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["snapshot"] == snapshot
+    assert data["context"] == snapshot
+    assert data["system_prompt"] == "You are The Catalyst."
+    assert data["reference"] is None
+    assert wrong_thread.status_code == 404
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+def test_conversation_uuid_defaults_on_insert():
+    _clear_conversations()
+    session = SessionLocal()
+    try:
+        record = models.Conversation(session_type="general", messages={"user": "Hi"})
+        session.add(record)
+        session.commit()
+        assert uuid.UUID(record.conversation_uuid)
+    finally:
+        session.close()
+
+
+def test_recent_greeting_rows_trim_oldest_past_character_budget():
+    _clear_conversations()
+    session = SessionLocal()
+    try:
+        for index in range(4):
+            session.add(
+                models.Conversation(
+                    conversation_uuid="budget",
+                    session_type="general",
+                    messages={
+                        "user": f"{index}" * 10000,
+                        "catalyst": "ok",
+                        "system_prompt": "x" * 50000,
+                    },
+                )
+            )
+        session.flush()
+        session.execute(
+            text(
+                "INSERT INTO conversations (conversation_uuid, session_type, messages) "
+                "VALUES ('budget', 'general', '{not json')"
+            )
+        )
+        session.commit()
+
+        rows = _recent_greeting_rows(session, utc_now() - timedelta(hours=1))
+    finally:
+        session.close()
+
+    assert [(row.user or "")[:1] for row in rows] == ["1", "2", "3", ""]
+    assert all(row.conversation_uuid == "budget" for row in rows)
+
+
+def test_recent_conversations_preview_is_truncated_in_sql():
+    _clear_conversations()
+    session = SessionLocal()
+    try:
+        session.add(
+            models.Conversation(
+                conversation_uuid=str(uuid.uuid4()),
+                session_type="general",
+                messages={
+                    "user": "Preview me",
+                    "catalyst": "y" * 300,
+                    "function_calls": [{"name": "log_daily_reflection"}],
+                },
+            )
+        )
+        session.commit()
+    finally:
+        session.close()
+
+    with client_context() as client:
+        response = client.get("/conversations/recent")
+
+    assert response.status_code == 200
+    item = response.json()[0]
+    assert item["user_message"] == "Preview me"
+    assert item["catalyst_response"] == "y" * 200 + "..."
+    assert item["function_calls"] == 1
+
+
 def test_export_conversation_as_markdown():
     _clear_conversations()
     conversation_id = _create_conversation()
@@ -156,7 +351,8 @@ def test_chat_does_not_duplicate_initial_greeting(monkeypatch):
             models.Conversation(
                 conversation_uuid=existing_conversation_id,
                 session_type="general",
-                messages=json.dumps(greeting_payload),
+                messages=greeting_payload,
+                is_initial_greeting=True,
             )
         )
         session.commit()
@@ -207,11 +403,48 @@ def test_chat_does_not_duplicate_initial_greeting(monkeypatch):
         )
         assert len(records) == 2
 
-        greeting_count = 0
-        for record in records:
-            stored_payload = json.loads(record.messages or "{}")
-            if stored_payload.get("initial_greeting"):
-                greeting_count += 1
-        assert greeting_count == 1
+        assert sum(record.is_initial_greeting for record in records) == 1
+    finally:
+        session.close()
+
+
+def test_initial_greeting_reuses_cached_reply_until_user_speaks(monkeypatch):
+    _clear_conversations()
+    session = SessionLocal()
+    try:
+        if not session.query(models.Goal).count():
+            session.add(models.Goal(description="Test goal", rank=1))
+            session.commit()
     finally:
         session.close()
+
+    calls = []
+
+    async def _fake_generate_catalyst_response(*_args, **_kwargs):
+        calls.append(_args)
+        return {
+            "response": f"Greeting {len(calls)}",
+            "memory_updated": False,
+            "function_calls": [],
+            "model": "mock-model",
+        }
+
+    monkeypatch.setattr(
+        "backend.routers.chat.generate_catalyst_response",
+        _fake_generate_catalyst_response,
+    )
+    monkeypatch.setattr("backend.routers.chat._greeting_cache", {})
+
+    with client_context() as client:
+        first = client.post("/initial-greeting", json={"session_type": "general"})
+        second = client.post("/initial-greeting", json={"session_type": "general"})
+        _create_conversation()
+        third = client.post("/initial-greeting", json={"session_type": "general"})
+
+    assert [r.status_code for r in (first, second, third)] == [200, 200, 200]
+    assert first.json()["cache_hit"] is False
+    assert second.json()["cache_hit"] is True
+    assert second.json()["response"] == "Greeting 1"
+    assert second.json()["conversation_id"] != first.json()["conversation_id"]
+    assert third.json()["response"] == "Greeting 2"
+    assert len(calls) == 2
@@ -12,7 +12,14 @@ from fastapi.testclient import TestClient  # noqa: E402
 from backend import models  # noqa: E402
 from backend.app import app  # noqa: E402
 from backend.database import SessionLocal, init_database  # noqa: E402
-from backend.memory_manager import compute_streak, sync_ltm_north_star  # noqa: E402
+from backend.memory_manager import (  # noqa: E402
+    compute_streak,
+    get_goals_hierarchy,
+    get_recent_insights,
+    record_ritual_log,
+    sync_ltm_north_star,
+)
+from backend.routers.chat import _record_session_activity  # noqa: E402
 from backend.time_utils import local_today  # noqa: E402
 
 init_database()
@@ -181,6 +188,62 @@ def test_sync_ltm_north_star_updates_section() -> None:
         session.close()
 
 
+def test_goals_hierarchy_cache_is_dropped_on_commit() -> None:
+    _clear_goals()
+    _seed_goal()
+    session = SessionLocal()
+    try:
+        first = get_goals_hierarchy(session)
+        assert get_goals_hierarchy(session) is first
+
+        session.add(models.Goal(description="Sub goal", rank=2))
+        session.flush()
+        assert get_goals_hierarchy(session) is first
+
+        session.commit()
+        refreshed = get_goals_hierarchy(session)
+        assert [goal["description"] for goal in refreshed] == [
+            "North Star goal",
+            "Sub goal",
+        ]
+    finally:
+        session.close()
+
+
+def test_recent_insights_cache_is_dropped_on_commit() -> None:
+    session = SessionLocal()
+    try:
+        session.query(models.Insight).delete()
+        session.commit()
+        assert get_recent_insights(session) == []
+
+        session.add(
+            models.Insight(description="Writes best at night", importance_score=3)
+        )
+        session.commit()
+        cached = get_recent_insights(session)
+        assert [item["description"] for item in cached] == ["Writes best at night"]
+        assert get_recent_insights(session) is cached
+    finally:
+        session.close()
+
+
+def test_recent_logs_route_cache_is_dropped_by_ritual_log() -> None:
+    _clear_goals()
+    client = TestClient(app)
+    assert client.get("/logs/recent").json() == []
+
+    session = SessionLocal()
+    try:
+        record_ritual_log(session, "morning", "Ship the draft", local_today())
+        session.commit()
+    finally:
+        session.close()
+
+    logs = client.get("/logs/recent").json()
+    assert [log["morning_intention"] for log in logs] == ["Ship the draft"]
+
+
 def test_compute_streak_counts_consecutive_days() -> None:
     _clear_goals()
     today = local_today()
@@ -219,6 +282,53 @@ def test_compute_streak_grace_for_today_without_activity() -> None:
         session.close()
 
 
+def test_record_ritual_log_upserts_single_row_per_day() -> None:
+    _clear_goals()
+    today = local_today()
+    session = SessionLocal()
+    try:
+        record_ritual_log(session, "morning", "Ship the draft", day=today)
+        record_ritual_log(session, "evening", "Draft shipped", day=today)
+        record_ritual_log(session, "general", "Ignored", day=today)
+        session.commit()
+
+        logs = session.query(models.DailyLog).filter(models.DailyLog.date == today).all()
+        assert len(logs) == 1
+        assert logs[0].morning_completed and logs[0].evening_completed
+        assert logs[0].morning_intention == "Ship the draft"
+        assert logs[0].evening_reflection == "Draft shipped"
+        assert compute_streak(session) == 1
+    finally:
+        session.close()
+
+
+def test_chat_session_activity_commits_ritual_log() -> None:
+    _clear_goals()
+    today = local_today()
+    session = SessionLocal()
+    try:
+        _record_session_activity(session, "morning", "Plan", today, True)
+    finally:
+        session.close()
+
+    session = SessionLocal()
+    try:
+        log = session.query(models.DailyLog).filter(models.DailyLog.date == today).one()
+        assert log.morning_completed
+        assert log.morning_intention == "Plan"
+        tracking = (
+            session.query(models.SessionTracking)
+            .order_by(models.SessionTracking.id.desc())
+            .first()
+        )
+        assert tracking.last_morning_session is not None
+        assert tracking.streak_count == 1
+        session.query(models.SessionTracking).delete()
+        session.commit()
+    finally:
+        session.close()
+
+
 def test_stats_endpoint_uses_computed_streak() -> None:
     _clear_goals()
     today = local_today()
@@ -242,4 +352,53 @@ def test_stats_endpoint_uses_computed_streak() -> None:
     with TestClient(app) as client:
         response = client.get("/stats")
     assert response.status_code == 200
-    assert response.json()["streak"] == 2
+    data = response.json()
+    assert data["streak"] == 2
+    assert data["total_sessions"] == 5
+    assert data["completion_rate"]["morning"] == 100
+
+    session = SessionLocal()
+    try:
+        tracking = session.query(models.SessionTracking).one()
+        assert tracking.streak_count == 2
+        session.delete(tracking)
+        session.commit()
+    finally:
+        session.close()
+
+
+def test_recent_logs_and_insights_serialize_rows() -> None:
+    _clear_goals()
+    today = local_today()
+    session = SessionLocal()
+    try:
+        session.query(models.Insight).delete()
+        session.add(models.DailyLog(date=today, morning_completed=True, wins="Shipped"))
+        session.add(models.Insight(description="Works best early", importance_score=4))
+        session.commit()
+    finally:
+        session.close()
+
+    with TestClient(app) as client:
+        logs = client.get("/logs/recent").json()
+        insights = client.get("/insights").json()
+
+    assert logs[0]["date"] == today.isoformat()
+    assert logs[0]["morning_completed"] is True
+    assert logs[0]["wins"] == "Shipped"
+    assert insights[0]["description"] == "Works best early"
+    assert insights[0]["date_identified"]
+
+    # The route cache holds plain entries, not rows bound to a closed session.
+    from backend import memory_manager
+
+    cached = [
+        value
+        for (key, _variant), (_stored, value) in memory_manager._context_cache.items()
+        if key in ("recent_logs", "insight_list")
+    ]
+    assert cached
+    assert {type(entry).__name__ for entries in cached for entry in entries} == {
+        "DailyLogEntry",
+        "InsightEntry",
+    }
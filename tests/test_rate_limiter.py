@@ -72,6 +72,25 @@ def test_token_estimation():
     assert estimate_tokens("Long text", "More text") > estimate_tokens("Short")
 
 
+def test_token_estimation_calibrates_from_reported_usage(monkeypatch):
+    """Provider prompt counts pull the chars-per-token ratio toward reality."""
+    from backend import rate_limiter as module
+
+    monkeypatch.setattr(module, "_chars_per_token", 4.0)
+    monkeypatch.setattr(module, "_chars_per_token_dev", 0.0)
+    text = "x" * 4000
+    assert estimate_tokens(text) == 1000
+
+    for _ in range(200):
+        module.calibrate_token_estimate(3000, 1000)  # 3 chars per token observed
+
+    assert 1300 <= estimate_tokens(text) <= 1400
+
+    module.calibrate_token_estimate(0, 1000)
+    module.calibrate_token_estimate(3000, None)
+    assert 1300 <= estimate_tokens(text) <= 1400
+
+
 @pytest.mark.asyncio
 async def test_no_limits_for_unknown_model(rate_limiter):
     """Test that unknown models have no limits."""
@@ -116,6 +135,21 @@ async def test_get_wait_time(rate_limiter):
     assert wait_time_fast == 0
 
 
+@pytest.mark.asyncio
+async def test_get_wait_times_batches_models(rate_limiter):
+    """get_wait_times reports every model in one call, unknown models at zero."""
+
+    for _ in range(5):
+        await rate_limiter.wait_for_request("test-model")
+
+    waits = await rate_limiter.get_wait_times(
+        ("test-model", "fast-model", "unlisted-model")
+    )
+    assert waits["test-model"] > 0
+    assert waits["fast-model"] == 0
+    assert waits["unlisted-model"] == 0
+
+
 @pytest.mark.asyncio
 async def test_register_backoff(rate_limiter):
     """Server-directed backoff should delay future requests."""
@@ -130,5 +164,22 @@ async def test_register_backoff(rate_limiter):
     assert elapsed >= 0.45
 
 
+@pytest.mark.asyncio
+async def test_snapshot_reports_window_usage(rate_limiter):
+    """Snapshot should count live entries for tracked models only."""
+
+    for _ in range(2):
+        await rate_limiter.wait_for_request("test-model")
+    await rate_limiter.record_usage("test-model", 120)
+
+    usage = await rate_limiter.snapshot()
+
+    assert set(usage) == {"test-model"}
+    assert usage["test-model"].minute_requests == 2
+    assert usage["test-model"].day_requests == 2
+    assert usage["test-model"].minute_tokens == 120
+    assert 0 < usage["test-model"].minute_requests_reset_in <= 60.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
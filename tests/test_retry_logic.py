@@ -3,10 +3,15 @@
 
 import sys
 
+import pytest
+
+from backend import catalyst_ai
 from backend.catalyst_ai import (
+    QuotaErrorInfo,
     _calculate_retry_delay,
     _is_retryable_error,
     _parse_quota_error,
+    _quota_retry_delay,
 )
 
 
@@ -100,6 +105,81 @@ def test_parse_quota_error():
     assert "Quota" in info.message or "quota" in info.message
 
 
+def test_quota_retry_delay_honours_retry_after():
+    """Server-provided retry_after wins over exponential backoff."""
+
+    info = QuotaErrorInfo(status_code=429, message="quota", retry_after=24.0)
+    for attempt in range(4):
+        delay = _quota_retry_delay(info, attempt)
+        assert 24.0 <= delay <= 24.0 * 1.1
+
+    no_hint = QuotaErrorInfo(status_code=429, message="quota", retry_after=None)
+    assert 0.1 <= _quota_retry_delay(no_hint, 0) <= 1.1
+
+
+class _NoopRateLimiter:
+    async def get_wait_times(self, models, tokens):
+        return {model: 0.0 for model in models}
+
+    async def wait_for_request(self, model, tokens):
+        return None
+
+    async def record_usage(self, model, tokens):
+        return None
+
+    async def register_backoff(self, model, seconds):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_skips_tripped_model(monkeypatch):
+    """A model that keeps returning 503s is skipped until its cooldown ends."""
+
+    calls = []
+
+    async def fake_acompletion(*, model, **kwargs):
+        calls.append(model)
+        if model == "primary":
+            raise Exception("503 Service Unavailable")
+        return {"choices": []}
+
+    async def no_sleep(_delay):
+        return None
+
+    monkeypatch.setattr(catalyst_ai, "acompletion", fake_acompletion)
+    monkeypatch.setattr(catalyst_ai, "rate_limiter", _NoopRateLimiter())
+    monkeypatch.setattr(catalyst_ai, "ALT_MODEL_NAME", "fallback")
+    monkeypatch.setattr(catalyst_ai.asyncio, "sleep", no_sleep)
+    monkeypatch.setattr(catalyst_ai, "_model_failures", {})
+    monkeypatch.setattr(catalyst_ai, "_model_tripped_at", {})
+
+    for _ in range(catalyst_ai.BREAKER_THRESHOLD):
+        _, used = await catalyst_ai._make_api_call_with_retry(
+            "primary", [], estimated_prompt_tokens=1
+        )
+        assert used == "fallback"
+    assert catalyst_ai._breaker_open("primary")
+
+    calls.clear()
+    _, used = await catalyst_ai._make_api_call_with_retry(
+        "primary", [], estimated_prompt_tokens=1
+    )
+    assert used == "fallback"
+    assert calls == ["fallback"]
+
+    # After the cooldown exactly one caller is let through as the probe.
+    catalyst_ai._model_tripped_at["primary"] -= catalyst_ai.BREAKER_COOLDOWN
+    assert not catalyst_ai._breaker_open("primary")
+    assert catalyst_ai._breaker_open("primary")
+
+    catalyst_ai._model_tripped_at["primary"] -= catalyst_ai.BREAKER_COOLDOWN
+    calls.clear()
+    await catalyst_ai._make_api_call_with_retry(
+        "primary", [], estimated_prompt_tokens=1
+    )
+    assert calls[0] == "primary"
+
+
 if __name__ == "__main__":
     print("🚀 Starting retry logic tests...\n")
 
@@ -76,3 +76,53 @@ def test_apply_envelope_actions_memory_update(monkeypatch):
     assert len(executed) == 1
     assert executed[0]["function"] == "update_ltm_profile"
     assert calls[0]["summary_text"].startswith("## Overview")
+
+
+def test_load_base_prompt_rereads_only_when_file_changes(monkeypatch, tmp_path):
+    import os
+
+    from backend import catalyst_ai
+
+    prompt_path = tmp_path / "system_prompt.md"
+    prompt_path.write_text("First prompt", encoding="utf-8")
+    monkeypatch.setattr(catalyst_ai, "SYSTEM_PROMPT_PATH", prompt_path)
+    monkeypatch.setattr(catalyst_ai, "_base_prompt_cache", None)
+
+    text, metadata = catalyst_ai._load_base_prompt()
+    assert text == "First prompt"
+    assert metadata["source"] == "file"
+
+    cached = catalyst_ai._base_prompt_cache
+    assert catalyst_ai._load_base_prompt() == (text, metadata)
+    assert catalyst_ai._base_prompt_cache is cached
+
+    prompt_path.write_text("Second prompt!", encoding="utf-8")
+    os.utime(prompt_path, ns=(0, prompt_path.stat().st_mtime_ns + 1_000_000))
+    text, updated = catalyst_ai._load_base_prompt()
+    assert text == "Second prompt!"
+    assert updated["checksum"] != metadata["checksum"]
+
+
+def test_json_safe_snapshot_copies_containers_and_stringifies_leaves():
+    from datetime import datetime, timezone
+
+    from backend.catalyst_ai import _json_safe
+    from backend.schemas import SessionType
+
+    stamp = datetime(2025, 1, 2, 3, 4, tzinfo=timezone.utc)
+    context = {
+        "goals": [{"id": 1, "description": "Ship it", "tags": ("a", "b")}],
+        "session_type": SessionType.MORNING,
+        "updated_at": stamp,
+        7: None,
+    }
+
+    snapshot = _json_safe(context)
+    assert snapshot == {
+        "goals": [{"id": 1, "description": "Ship it", "tags": ["a", "b"]}],
+        "session_type": "morning",
+        "updated_at": stamp.isoformat(),
+        "7": None,
+    }
+    assert snapshot["goals"] is not context["goals"]
+    assert json.loads(json.dumps(snapshot)) == snapshot